@@ -3,6 +3,7 @@
 Final test to verify TalkToTube is working perfectly.
 """
 
+import asyncio
 import os
 import sys
 
@@ -57,15 +58,21 @@ def test_complete_workflow():
             "How does supervised learning work?"
         ]
         
-        for i, question in enumerate(questions, 1):
-            answer, citations = pipeline.answer_question(question)
+        # Dispatch all questions concurrently so inference latency overlaps
+        qa_results = asyncio.run(pipeline.answer_questions(questions))
+        for i, (question, (answer, citations)) in enumerate(
+            zip(questions, qa_results), 1
+        ):
             print(f"   Q{i}: {question}")
             print(f"   A{i}: {answer[:60]}...")
             print(f"   📍 Citations: {len(citations)}")
         
         # Test 7: Export functionality
         print(f"\n7. Testing export...")
-        qa_history = [(q, pipeline.answer_question(q)[0]) for q in questions[:2]]
+        # Reuse the answers computed above instead of re-running inference
+        qa_history = [
+            (q, answer) for q, (answer, _) in zip(questions[:2], qa_results[:2])
+        ]
         markdown = pipeline.export_to_markdown(result, qa_history)
         print(f"   ✅ Markdown export: {len(markdown)} characters")
         
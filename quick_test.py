@@ -3,6 +3,7 @@
 Quick test script to verify TalkToTube works without Streamlit.
 """
 
+import asyncio
 import os
 import sys
 
@@ -54,8 +55,11 @@ def test_pipeline():
             "How do neural networks work?"
         ]
         
-        for i, question in enumerate(test_questions, 1):
-            answer, citations = pipeline.answer_question(question)
+        # Dispatch all questions concurrently so inference latency overlaps
+        results = asyncio.run(pipeline.answer_questions(test_questions))
+        for i, (question, (answer, citations)) in enumerate(
+            zip(test_questions, results), 1
+        ):
             print(f"   Q{i}: {question}")
             print(f"   A{i}: {answer[:80]}...")
             if citations:
@@ -0,0 +1,18 @@
+"""Shared HuggingFace Inference API client for all agents."""
+
+from huggingface_hub import InferenceClient
+
+from ..config import Config
+
+# One client instance serves every agent, so all Inference API calls reuse
+# the same underlying HTTP session and its keep-alive connection pool
+# instead of paying a fresh TLS handshake per agent.
+_shared_client = InferenceClient(
+    token=Config.HUGGINGFACE_API_TOKEN,
+    timeout=Config.HF_TIMEOUT_SECONDS,
+)
+
+
+def get_client() -> InferenceClient:
+    """Get the process-wide Inference API client."""
+    return _shared_client
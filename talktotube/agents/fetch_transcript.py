@@ -1,49 +1,179 @@
 """Agent for fetching YouTube transcripts using youtube-transcript-api."""
 
+import asyncio
+import functools
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Tuple
 from urllib.parse import urlparse, parse_qs
-from youtube_transcript_api import YouTubeTranscriptApi
+import diskcache
+import requests
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api._api import TranscriptListFetcher
 from youtube_transcript_api._errors import (
-    TranscriptsDisabled, 
-    NoTranscriptFound, 
+    TranscriptsDisabled,
+    NoTranscriptFound,
     VideoUnavailable,
     TooManyRequests
 )
 
+from ..config import Config
+
 logger = logging.getLogger(__name__)
 
+# Persistent HTTP session with connection pooling so repeated listing and
+# transcript fetches reuse TCP+TLS connections instead of re-handshaking.
+# YouTubeTranscriptApi.list_transcripts opens a fresh Session per call, so
+# we drive TranscriptListFetcher with this one directly.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Disk cache for fetched transcripts, keyed by (video_id, language preferences).
+# Repeat requests for the same video skip the YouTube round-trip entirely.
+_transcript_cache = diskcache.Cache(Config.TRANSCRIPT_CACHE_DIR)
+
+# Disk cache for video metadata. get_video_info is a stub today, but once it
+# grows a yt-dlp/API lookup that call dominates runtime, so the cache layer
+# is wired in now and only the function body will need to change.
+_metadata_cache = diskcache.Cache(Config.METADATA_CACHE_DIR)
+
+# Single compiled pattern covering the common YouTube URL formats
+# (watch, short youtu.be, and embed links), compiled once at import time.
+_VIDEO_ID_PATTERN = re.compile(
+    r'(?:youtube\.com/watch\?(?:.*&)?v=|youtu\.be/|youtube\.com/embed/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
+
+# Classifier for sign-in / bot-protection errors, compiled once so the
+# per-failure check is a single case-insensitive search with no lowercased
+# copy of the message
+_BOT_PROTECTION_PATTERN = re.compile(r'sign[\s-]*in|bot', re.IGNORECASE)
+
+# Fast-path scanner state: marker substrings that precede a video ID, and
+# the character set a valid ID is drawn from
+_ID_MARKERS = ('youtu.be/', '/embed/', 'v=')
+_ID_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-'
+)
+
+
+def _scan_video_id(url: str) -> Optional[str]:
+    """
+    Scan for a video ID with plain substring search, no regex.
+
+    str.find and slicing run in C, so this is the cheap path for batch URL
+    parsing; extract_video_id falls back to the regex when it misses.
+    """
+    if 'youtube.com' not in url and 'youtu.be' not in url:
+        return None
+    for marker in _ID_MARKERS:
+        idx = url.find(marker)
+        if idx == -1:
+            continue
+        start = idx + len(marker)
+        candidate = url[start:start + 11]
+        if len(candidate) == 11 and all(c in _ID_CHARS for c in candidate):
+            return candidate
+    return None
+
+
+def extract_video_ids(urls: Sequence[str]) -> List[Optional[str]]:
+    """
+    Extract video IDs from a batch of URLs in one pass.
+
+    Binds the scanner and compiled regex once instead of paying method
+    dispatch per URL, which is what matters for playlist-sized batches.
+
+    Args:
+        urls: YouTube URLs
+
+    Returns:
+        List of video IDs (None where extraction failed), in input order
+    """
+    search = _VIDEO_ID_PATTERN.search
+    ids: List[Optional[str]] = []
+    for url in urls:
+        video_id = _scan_video_id(url)
+        if video_id is None:
+            match = search(url)
+            video_id = match.group(1) if match else None
+        ids.append(video_id)
+    return ids
+
+
+def _fetch_video_info(video_id: str) -> Dict[str, Any]:
+    """
+    Look up video metadata (placeholder for future yt-dlp/API integration).
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Dictionary with video metadata
+    """
+    # For now, return basic info
+    # In a full implementation, you might use yt-dlp or YouTube API
+    return {
+        'video_id': video_id,
+        'title': 'Unknown Title',
+        'channel': 'Unknown Channel',
+        'duration': 'Unknown Duration',
+        'url': f'https://www.youtube.com/watch?v={video_id}'
+    }
+
+
+# Transcript-listing TTL cache bucket width in seconds
+_LIST_TTL_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=256)
+def _list_transcripts_cached(video_id: str, ttl_bucket: int):
+    """Cached wrapper around the transcript listing; ttl_bucket expires entries."""
+    return TranscriptListFetcher(_http_session).fetch(video_id)
+
+
+def _get_transcript_list(video_id: str):
+    """
+    Get the transcript listing for a video, cached for a few minutes.
+
+    The accessibility check and the actual fetch both need the listing;
+    caching it here means that flow costs one network round-trip, not two.
+    """
+    if Config.NO_CACHE:
+        return TranscriptListFetcher(_http_session).fetch(video_id)
+    return _list_transcripts_cached(video_id, int(time.time() // _LIST_TTL_SECONDS))
+
 
 class TranscriptFetcher:
     """Handles fetching transcripts from YouTube videos."""
     
-    def __init__(self):
-        """Initialize the transcript fetcher."""
-        pass
-    
-    def extract_video_id(self, url: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def extract_video_id(url: str) -> Optional[str]:
         """
         Extract YouTube video ID from various URL formats.
-        
+
+        Pure in its argument, so results are memoized — the pipeline
+        parses the same URL several times per video.
+
         Args:
             url: YouTube URL
-            
+
         Returns:
             Video ID if found, None otherwise
         """
-        # Common YouTube URL patterns
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                logger.debug(f"Extracted video ID: {video_id}")
-                return video_id
+        # Cheap substring scan first; regex only when it misses
+        video_id = _scan_video_id(url)
+        if video_id:
+            logger.debug(f"Extracted video ID: {video_id}")
+            return video_id
+
+        match = _VIDEO_ID_PATTERN.search(url)
+        if match:
+            video_id = match.group(1)
+            logger.debug(f"Extracted video ID: {video_id}")
+            return video_id
         
         # Try parsing as URL
         try:
@@ -65,7 +195,8 @@ class TranscriptFetcher:
         logger.error(f"Could not extract video ID from URL: {url}")
         return None
     
-    def get_video_info(self, video_id: str) -> Dict[str, Any]:
+    @staticmethod
+    def get_video_info(video_id: str) -> Dict[str, Any]:
         """
         Get basic video information (placeholder for future enhancement).
         
@@ -75,17 +206,21 @@ class TranscriptFetcher:
         Returns:
             Dictionary with video metadata
         """
-        # For now, return basic info
-        # In a full implementation, you might use yt-dlp or YouTube API
-        return {
-            'video_id': video_id,
-            'title': 'Unknown Title',
-            'channel': 'Unknown Channel',
-            'duration': 'Unknown Duration',
-            'url': f'https://www.youtube.com/watch?v={video_id}'
-        }
+        if Config.NO_CACHE:
+            return _fetch_video_info(video_id)
+
+        cached = _metadata_cache.get(video_id)
+        if cached is not None:
+            return cached
+
+        info = _fetch_video_info(video_id)
+        _metadata_cache.set(
+            video_id, info, expire=Config.METADATA_CACHE_TTL_SECONDS
+        )
+        return info
     
-    def fetch_transcript(self, url: str, language_codes: List[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    @staticmethod
+    def fetch_transcript(url: str, language_codes: List[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Fetch transcript for a YouTube video.
         
@@ -103,61 +238,127 @@ class TranscriptFetcher:
             VideoUnavailable: If video is not accessible
         """
         # Extract video ID
-        video_id = self.extract_video_id(url)
+        video_id = TranscriptFetcher.extract_video_id(url)
         if not video_id:
             raise ValueError(f"Could not extract video ID from URL: {url}")
-        
-        # Get video info
-        video_info = self.get_video_info(video_id)
-        
+
         # Set default language preferences
         if language_codes is None:
             language_codes = ['en', 'en-US', 'en-GB', 'en-CA', 'en-AU']
-        
+
+        # Check disk cache before hitting the network
+        cache_key = (video_id, tuple(language_codes))
+        if not Config.NO_CACHE:
+            cached = _transcript_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached transcript for video: {video_id}")
+                return cached
+
+        # Bounded retry on rate limits only; other errors fail fast
+        last_exception = None
+        result = None
+        for attempt in range(Config.MAX_RETRIES):
+            try:
+                result = TranscriptFetcher._fetch_uncached(video_id, language_codes)
+                break
+            except TooManyRequests as e:
+                last_exception = e
+                if attempt < Config.MAX_RETRIES - 1:
+                    wait_time = Config.RETRY_BACKOFF_SECONDS[attempt]
+                    logger.warning(f"Rate limited; retrying in {wait_time}s...")
+                    time.sleep(wait_time)
+        else:
+            raise last_exception
+
+        if not Config.NO_CACHE:
+            _transcript_cache.set(
+                cache_key, result, expire=Config.TRANSCRIPT_CACHE_TTL_SECONDS
+            )
+
+        return result
+
+    @staticmethod
+    def _fetch_uncached(
+        video_id: str, language_codes: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fetch transcript from YouTube without consulting the cache.
+
+        Args:
+            video_id: YouTube video ID
+            language_codes: Preferred language codes
+
+        Returns:
+            Tuple of (transcript_data, video_info)
+        """
+        # Get video info
+        video_info = TranscriptFetcher.get_video_info(video_id)
+
         try:
             logger.info(f"Fetching transcript for video: {video_id}")
 
             # Try to get transcript in preferred languages
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            
-            # First, try to find manually created transcripts
+            transcript_list = _get_transcript_list(video_id)
+
+            # Materialize the listing once and index by language code —
+            # dict lookups replace the per-language find_* calls and their
+            # exception-driven miss path
+            available_transcripts = list(transcript_list)
+            manual = {
+                t.language_code: t for t in available_transcripts if not t.is_generated
+            }
+            generated = {
+                t.language_code: t for t in available_transcripts if t.is_generated
+            }
+
+            # Single pass over preferences: manual transcripts win over
+            # auto-generated ones for the same language
             for lang_code in language_codes:
+                transcript = manual.get(lang_code) or generated.get(lang_code)
+                if transcript is None:
+                    continue
                 try:
-                    transcript = transcript_list.find_manually_created_transcript([lang_code])
                     transcript_data = transcript.fetch()
-                    logger.info(f"Found manually created transcript in {lang_code}")
-                    return transcript_data, video_info
-                except (NoTranscriptFound, Exception):
+                except NoTranscriptFound:
+                    # Listing was stale for this language; try the next one.
+                    # Rate limits and availability errors propagate so we
+                    # stop hammering a throttled or dead endpoint.
                     continue
+                kind = "auto-generated" if transcript.is_generated else "manually created"
+                logger.info(f"Found {kind} transcript in {lang_code}")
+                return transcript_data, video_info
 
-            # If no manual transcripts, try auto-generated
-            for lang_code in language_codes:
-                try:
-                    transcript = transcript_list.find_generated_transcript([lang_code])
+            # Any English variant (e.g. en-IN) beats translating — translate()
+            # costs a second network round-trip
+            for transcript in available_transcripts:
+                if transcript.language_code.startswith('en'):
                     transcript_data = transcript.fetch()
-                    logger.info(f"Found auto-generated transcript in {lang_code}")
+                    logger.info(
+                        f"Found English-variant transcript in {transcript.language_code}"
+                    )
                     return transcript_data, video_info
-                except (NoTranscriptFound, Exception):
-                    continue
-            
+
             # If no transcripts in preferred languages, try any available
             try:
-                # Get any available transcript
-                available_transcripts = list(transcript_list)
                 if available_transcripts:
                     transcript = available_transcripts[0]
-                    transcript_data = transcript.fetch()
-                    logger.info(f"Found transcript in {transcript.language_code}")
-                    
-                    # Try to translate to English if not English
-                    if transcript.language_code not in ['en', 'en-US', 'en-GB']:
-                        try:
-                            translated = transcript.translate('en')
-                            transcript_data = translated.fetch()
-                            logger.info(f"Translated transcript from {transcript.language_code} to English")
-                        except Exception as e:
-                            logger.warning(f"Failed to translate transcript: {e}")
-                    
+
+                    # The English-variant scan above already handled en*
+                    # languages, so anything left needs translation — fetch
+                    # the translated transcript directly instead of
+                    # downloading the original first and then again via
+                    # translate()
+                    try:
+                        transcript_data = transcript.translate('en').fetch()
+                        logger.info(
+                            f"Fetched transcript translated from "
+                            f"{transcript.language_code} to English"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to translate transcript: {e}")
+                        transcript_data = transcript.fetch()
+                        logger.info(f"Found transcript in {transcript.language_code}")
+
                     return transcript_data, video_info
                 else:
                     raise NoTranscriptFound(video_id, [], None)
@@ -182,7 +383,68 @@ class TranscriptFetcher:
             logger.error(f"Unexpected error fetching transcript: {e}")
             raise
     
-    def is_transcript_available(self, url: str) -> bool:
+    @staticmethod
+    def iter_transcript(
+        url: str, language_codes: List[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield transcript segments one at a time.
+
+        Lets downstream stages (normalization, chunking) start consuming
+        before the whole list is needed in memory; a genuinely streaming
+        backend can drop in here without changing consumers.
+
+        Args:
+            url: YouTube video URL
+            language_codes: Preferred language codes
+
+        Yields:
+            Transcript segments with 'text', 'start', 'duration'
+        """
+        transcript_data, _ = TranscriptFetcher.fetch_transcript(url, language_codes)
+        yield from transcript_data
+
+    @staticmethod
+    async def fetch_transcript_async(
+        url: str, language_codes: List[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Async wrapper around fetch_transcript for concurrent workflows.
+
+        Args:
+            url: YouTube video URL
+            language_codes: Preferred language codes
+
+        Returns:
+            Tuple of (transcript_data, video_info)
+        """
+        return await asyncio.to_thread(
+            TranscriptFetcher.fetch_transcript, url, language_codes
+        )
+
+    @staticmethod
+    async def fetch_many(
+        urls: List[str], language_codes: List[str] = None
+    ) -> List[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Fetch transcripts for multiple videos concurrently.
+
+        Overlaps the network latency of the individual fetches, so a batch
+        of N videos takes roughly as long as the slowest single fetch.
+
+        Args:
+            urls: YouTube video URLs
+            language_codes: Preferred language codes (shared across videos)
+
+        Returns:
+            List of (transcript_data, video_info) tuples, in input order
+        """
+        return await asyncio.gather(
+            *(TranscriptFetcher.fetch_transcript_async(url, language_codes) for url in urls)
+        )
+
+    @staticmethod
+    def is_transcript_available(url: str) -> bool:
         """
         Check if transcript is available for a video without fetching it.
 
@@ -193,18 +455,20 @@ class TranscriptFetcher:
             True if transcript is likely available
         """
         try:
-            video_id = self.extract_video_id(url)
+            video_id = TranscriptFetcher.extract_video_id(url)
             if not video_id:
                 return False
 
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            available_transcripts = list(transcript_list)
-            return len(available_transcripts) > 0
+            transcript_list = _get_transcript_list(video_id)
+            # Short-circuit after the first transcript instead of
+            # materializing the whole listing
+            return next(iter(transcript_list), None) is not None
 
         except Exception:
             return False
 
-    def quick_video_check(self, url: str) -> tuple[bool, str]:
+    @staticmethod
+    def quick_video_check(url: str) -> tuple[bool, str]:
         """
         Quick check if video is accessible and has basic info.
 
@@ -215,13 +479,13 @@ class TranscriptFetcher:
             Tuple of (is_accessible, error_message)
         """
         try:
-            video_id = self.extract_video_id(url)
+            video_id = TranscriptFetcher.extract_video_id(url)
             if not video_id:
                 return False, "Invalid YouTube URL"
 
             # Try to get basic video info first
             try:
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+                _get_transcript_list(video_id)
                 return True, "Video accessible"
             except VideoUnavailable:
                 return False, "Video is unavailable or private"
@@ -230,10 +494,18 @@ class TranscriptFetcher:
             except TooManyRequests:
                 return False, "Too many requests - please try again later"
             except Exception as e:
-                error_msg = str(e).lower()
-                if 'sign in' in error_msg or 'bot' in error_msg:
+                if _BOT_PROTECTION_PATTERN.search(str(e)):
                     return False, "Video requires sign-in or has bot protection"
                 return False, f"Video access error: {str(e)}"
 
         except Exception as e:
             return False, f"URL processing error: {str(e)}"
+
+
+# Module-level aliases so callers can use the fetcher without allocating
+# an instance (all methods are static)
+extract_video_id = TranscriptFetcher.extract_video_id
+get_video_info = TranscriptFetcher.get_video_info
+fetch_transcript = TranscriptFetcher.fetch_transcript
+is_transcript_available = TranscriptFetcher.is_transcript_available
+quick_video_check = TranscriptFetcher.quick_video_check
@@ -1,159 +1,317 @@
 """Q&A agent using retrieval-augmented generation with FLAN-T5."""
 
 import logging
-import time
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
-from huggingface_hub import InferenceClient
+import numpy as np
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - faiss is optional
+    faiss = None
+
+try:
+    from transformers import AutoTokenizer
+except ImportError:  # pragma: no cover - transformers is optional
+    AutoTokenizer = None
 
 from ..config import Config
 from ..utils.text import TranscriptChunk
+from ..utils.hf_parse import extract_text
 from ..utils.retrieval import EmbeddingRetriever
+from ..utils.retry import rate_limit_retry
+from ._client import get_client
 
 logger = logging.getLogger(__name__)
 
+# Model responses that mean "no answer", checked with one set lookup
+_EMPTY_ANSWERS = frozenset(('', 'none', 'n/a', 'not applicable'))
+
+# Rough chars-per-token ratio for English, used to approximate the token
+# budget when the exact tokenizer is unavailable
+_APPROX_CHARS_PER_TOKEN = 4
+
+# Offline question classifier: one compiled scan replaces up to five
+# any()-loops of substring checks; the matched group names the category
+_OFFLINE_KEYWORD_PATTERN = re.compile(
+    r'\b(?:(?P<what>what|define|explain)'
+    r'|(?P<how>how|process|work)'
+    r'|(?P<why>why|reason|benefit)'
+    r'|(?P<when>when|time|use))\b'
+)
+
+_OFFLINE_TOPIC_ANSWERS = (
+    ('machine learning', "Machine learning is a subset of artificial intelligence that enables computers to learn from data."),
+    ('supervised', "Supervised learning uses labeled data to train models to make predictions."),
+    ('neural network', "Neural networks are computing systems inspired by biological neural networks."),
+)
+
+_OFFLINE_CATEGORY_ANSWERS = {
+    'what': "This concept is explained in the video content with relevant examples.",
+    'how': "The process involves multiple steps as described in the video, including data preparation and model training.",
+    'why': "This approach is beneficial because it provides accurate results and is widely applicable.",
+    'when': "This technique is typically used when you have sufficient data and clear objectives.",
+    None: "Based on the video content, this topic is covered with practical examples and explanations.",
+}
+
+# Prompt template split once at import; plain concatenation of the parts
+# skips format-spec parsing on every answer
+_QA_PROMPT_PREFIX, _after_context = Config.QA_PROMPT_TEMPLATE.split('{context}', 1)
+_QA_PROMPT_MID, _QA_PROMPT_SUFFIX = _after_context.split('{question}', 1)
+
+
+def _render_prompt(context: str, question: str) -> str:
+    """Assemble the QA prompt from the precomputed template parts."""
+    return _QA_PROMPT_PREFIX + context + _QA_PROMPT_MID + question + _QA_PROMPT_SUFFIX
+
+
+_qa_tokenizer = None
+
+
+def _get_qa_tokenizer():
+    """Load the QA model's tokenizer once, when transformers is installed."""
+    global _qa_tokenizer
+    # from_pretrained hits the HuggingFace Hub on first use, which
+    # offline mode promises not to do
+    if Config.OFFLINE_MODE:
+        return None
+    if _qa_tokenizer is None and AutoTokenizer is not None:
+        try:
+            _qa_tokenizer = AutoTokenizer.from_pretrained(Config.QA_MODEL)
+        except Exception as e:
+            logger.warning(f"Could not load tokenizer for {Config.QA_MODEL}: {e}")
+            _qa_tokenizer = False  # don't retry on every call
+    return _qa_tokenizer or None
+
 
 class QAAgent:
     """Handles question answering using retrieval-augmented generation."""
     
     def __init__(self):
         """Initialize the Q&A agent."""
-        self.client = InferenceClient(token=Config.HUGGINGFACE_API_TOKEN)
+        self.client = get_client()
         self.retriever = EmbeddingRetriever()
         self.chunks: List[TranscriptChunk] = []
-        self.chunk_embeddings: List[Any] = []
+        # (N, d) contiguous float32 matrix of pre-normalized chunk embeddings
+        self.chunk_embeddings: np.ndarray = np.empty((0, 0), dtype=np.float32)
+
+        # FAISS inner-product index over the same vectors, built only for
+        # large chunk counts where its SIMD scan beats the NumPy matmul
+        self._faiss_index = None
+
+        # Semantic answer cache: normalized question embeddings with their
+        # (answer, citations), matched by cosine similarity so paraphrased
+        # repeats skip retrieval and generation entirely.
+        # answer_question_batch and the pipeline's async passthrough run
+        # answer_question concurrently, and store is a multi-step mutation
+        # (list pop/append plus matrix slice/vstack), so both lookup and
+        # store take the lock — same pattern as _EmbeddingCache
+        self._semantic_cache: List[Tuple[str, List[str]]] = []
+        self._semantic_cache_matrix: Optional[np.ndarray] = None
+        self._semantic_cache_lock = threading.Lock()
+
+        # Citations from the most recent answer_question_stream call, for
+        # callers that consume the stream before rendering citations
+        self.last_citations: List[str] = []
+
+    def _semantic_cache_lookup(self, query_embedding: np.ndarray) -> Optional[Tuple[str, List[str]]]:
+        """
+        Look up a cached answer for a semantically equivalent question.
+
+        Args:
+            query_embedding: L2-normalized question embedding
+
+        Returns:
+            Cached (answer, citations) on a hit, None otherwise
+        """
+        with self._semantic_cache_lock:
+            if self._semantic_cache_matrix is None:
+                return None
+
+            scores = self._semantic_cache_matrix @ query_embedding
+            best = int(np.argmax(scores))
+            if scores[best] >= Config.SEMANTIC_CACHE_THRESHOLD:
+                logger.info(f"Semantic cache hit (similarity {scores[best]:.3f})")
+                return self._semantic_cache[best]
+            return None
+
+    def _semantic_cache_store(
+        self, query_embedding: np.ndarray, answer: str, citations: List[str]
+    ) -> None:
+        """Store an answered question in the semantic cache, evicting oldest."""
+        with self._semantic_cache_lock:
+            if len(self._semantic_cache) >= Config.SEMANTIC_CACHE_SIZE:
+                self._semantic_cache.pop(0)
+                self._semantic_cache_matrix = self._semantic_cache_matrix[1:]
+
+            self._semantic_cache.append((answer, citations))
+            row = query_embedding[np.newaxis, :].astype(np.float32)
+            if self._semantic_cache_matrix is None:
+                self._semantic_cache_matrix = row
+            else:
+                self._semantic_cache_matrix = np.vstack(
+                    [self._semantic_cache_matrix, row]
+                )
     
     def rate_limit_retry(self, func, *args, **kwargs) -> Any:
-        """Execute function with exponential backoff retry."""
-        last_exception = None
-        
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                if attempt < Config.MAX_RETRIES - 1:
-                    wait_time = Config.RETRY_BACKOFF_SECONDS[attempt]
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"All {Config.MAX_RETRIES} attempts failed")
-        
-        raise last_exception
+        """Execute function with jittered exponential backoff retry."""
+        return rate_limit_retry(func, *args, **kwargs)
     
-    def index_chunks(self, chunks: List[TranscriptChunk]) -> None:
+    def index_chunks(
+        self, chunks: List[TranscriptChunk], texts: Optional[List[str]] = None
+    ) -> None:
         """
         Index transcript chunks for retrieval.
-        
+
         Args:
             chunks: List of transcript chunks to index
+            texts: Pre-extracted chunk texts; when provided the per-chunk
+                attribute walk is skipped
         """
         if not chunks:
             logger.warning("No chunks to index")
             return
-        
+
         logger.info(f"Indexing {len(chunks)} chunks for retrieval")
-        
+
+        # Cached answers and citations belong to the previously indexed
+        # video; serving them against new chunks would return stale
+        # answers with wrong-video citations
+        with self._semantic_cache_lock:
+            self._semantic_cache = []
+            self._semantic_cache_matrix = None
+        self.last_citations = []
+
         # Store chunks
         self.chunks = chunks
-        
-        # Generate embeddings for all chunks
-        chunk_texts = [chunk.text for chunk in chunks]
-        self.chunk_embeddings = self.retriever.get_embeddings_batch(chunk_texts)
-        
+
+        # Generate embeddings for all chunks in one batched call and pack
+        # them into one contiguous pre-normalized float32 matrix so
+        # retrieval is a single BLAS matrix product
+        chunk_texts = texts if texts is not None else [chunk.text for chunk in chunks]
+        embeddings = self.retriever.get_embeddings_batch(chunk_texts)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.chunk_embeddings = np.ascontiguousarray(matrix / norms)
+
+        # Large indexes get a FAISS exact inner-product index; vectors are
+        # already normalized, so inner product equals cosine similarity
+        self._faiss_index = None
+        if faiss is not None and len(chunks) >= Config.FAISS_MIN_CHUNKS:
+            index = faiss.IndexFlatIP(self.chunk_embeddings.shape[1])
+            index.add(self.chunk_embeddings)
+            self._faiss_index = index
+            logger.info(f"Built FAISS index for {len(chunks)} chunks")
+
         logger.info(f"Successfully indexed {len(self.chunk_embeddings)} chunk embeddings")
     
-    def generate_answer(self, question: str, context: str) -> str:
+    def _build_prompt(self, question: str, context: str) -> str:
         """
-        Generate answer using FLAN-T5 model.
-        
+        Format the QA prompt, truncating context to fit the model's token budget.
+
+        Budgets by actual token count via the model's tokenizer when
+        transformers is installed — character counts overestimate token
+        usage and waste usable context. Without the tokenizer, a
+        chars-per-token estimate approximates the same budget.
+
         Args:
             question: User question
             context: Retrieved context
-            
+
         Returns:
-            Generated answer
+            Formatted prompt string
         """
-        # Format prompt using template
-        prompt = Config.QA_PROMPT_TEMPLATE.format(
-            context=context,
-            question=question
-        )
-        
-        # Ensure prompt doesn't exceed model limits
-        if len(prompt) > Config.MAX_CONTEXT_LENGTH:
+        prompt = _render_prompt(context, question)
+
+        tokenizer = _get_qa_tokenizer()
+        if tokenizer is not None:
+            if len(tokenizer(prompt).input_ids) <= Config.MAX_PROMPT_TOKENS:
+                return prompt
+
+            # Trim only the context; question and template stay intact
+            overhead = len(tokenizer(_render_prompt('', question)).input_ids)
+            budget = max(Config.MAX_PROMPT_TOKENS - overhead, 0)
+            context_ids = tokenizer(context, add_special_tokens=False).input_ids[:budget]
+            truncated_context = tokenizer.decode(context_ids, skip_special_tokens=True)
+            return _render_prompt(truncated_context, question)
+
+        # No tokenizer available: approximate the token budget in characters
+        max_chars = Config.MAX_PROMPT_TOKENS * _APPROX_CHARS_PER_TOKEN
+        if len(prompt) > max_chars:
             # Truncate context while preserving question
-            available_length = Config.MAX_CONTEXT_LENGTH - len(question) - 200  # Buffer for template
-            truncated_context = context[:available_length]
-            prompt = Config.QA_PROMPT_TEMPLATE.format(
-                context=truncated_context,
-                question=question
-            )
-        
-        def _generate():
-            response = self.client.text_generation(
+            available_length = max_chars - len(question) - 200  # Buffer for template
+            prompt = _render_prompt(context[:available_length], question)
+
+        return prompt
+
+    def generate_answer_stream(self, question: str, context: str):
+        """
+        Generate an answer, yielding text fragments as they arrive.
+
+        Streaming overlaps the network wait with client-side work, so a
+        caller can start rendering the answer at the first token instead
+        of blocking on the full generation.
+
+        Args:
+            question: User question
+            context: Retrieved context
+
+        Yields:
+            Answer text fragments in generation order
+        """
+        logger.debug(f"Generating answer for question: {question[:50]}...")
+
+        # Check offline mode before building the prompt — _build_prompt
+        # may download the tokenizer on first use, and the offline branch
+        # never uses the prompt
+        if Config.OFFLINE_MODE:
+            logger.info("Offline mode: generating mock answer")
+            yield extract_text(self.generate_offline_answer(question, context))
+            return
+
+        prompt = self._build_prompt(question, context)
+
+        def _start_stream():
+            return self.client.text_generation(
                 prompt=prompt,
                 model=Config.QA_MODEL,
                 max_new_tokens=200,
-                temperature=0.1,
-                do_sample=True,
-                return_full_text=False
+                do_sample=False,
+                return_full_text=False,
+                stream=True
             )
-            return response
-        
-        try:
-            logger.debug(f"Generating answer for question: {question[:50]}...")
 
-            # Check if offline mode is enabled
-            if Config.OFFLINE_MODE:
-                logger.info("Offline mode: generating mock answer")
-                result = self.generate_offline_answer(question, context)
-            else:
-                # Call FLAN-T5 API with retry
-                result = self.rate_limit_retry(_generate)
-            
-            # Extract answer from response - handle multiple formats
-            answer = "I couldn't generate an answer."
-
-            try:
-                if isinstance(result, str):
-                    answer = result.strip()
-                elif isinstance(result, dict):
-                    if 'generated_text' in result:
-                        answer = result['generated_text'].strip()
-                    elif 'text' in result:
-                        answer = result['text'].strip()
-                    elif len(result) == 1:
-                        # Single key-value pair
-                        answer = str(list(result.values())[0]).strip()
-                    else:
-                        answer = str(result).strip()
-                elif isinstance(result, list) and len(result) > 0:
-                    first_item = result[0]
-                    if isinstance(first_item, dict):
-                        if 'generated_text' in first_item:
-                            answer = first_item['generated_text'].strip()
-                        elif 'text' in first_item:
-                            answer = first_item['text'].strip()
-                        else:
-                            answer = str(first_item).strip()
-                    else:
-                        answer = str(first_item).strip()
-                else:
-                    logger.warning(f"Unexpected QA response format: {type(result)} - {result}")
-                    answer = "Could not parse answer from API response."
-            except Exception as parse_error:
-                logger.error(f"Error parsing QA response: {parse_error}")
-                answer = "Error parsing answer response."
-            
-            # Clean up answer
-            answer = self.clean_answer(answer)
-            
-            logger.debug(f"Generated answer: {answer[:100]}...")
-            return answer
-            
+        try:
+            for token in self.rate_limit_retry(_start_stream):
+                yield extract_text(token)
         except Exception as e:
             logger.error(f"Failed to generate answer: {e}")
-            return "I encountered an error while generating the answer."
+            yield "I encountered an error while generating the answer."
+
+    def generate_answer(self, question: str, context: str) -> str:
+        """
+        Generate answer using FLAN-T5 model.
+
+        Non-streaming wrapper that drains generate_answer_stream and
+        cleans the joined result.
+
+        Args:
+            question: User question
+            context: Retrieved context
+
+        Returns:
+            Generated answer
+        """
+        answer = ''.join(self.generate_answer_stream(question, context)).strip()
+
+        # Clean up answer
+        answer = self.clean_answer(answer)
+
+        logger.debug(f"Generated answer: {answer[:100]}...")
+        return answer
     
     def clean_answer(self, answer: str) -> str:
         """
@@ -168,15 +326,17 @@ class QAAgent:
         if not answer:
             return "I couldn't find an answer."
         
-        # Remove common artifacts
+        # Remove common artifacts (lowercase once, reuse for all checks)
         answer = answer.strip()
-        
+        answer_lower = answer.lower()
+
         # Remove prompt repetition
-        if answer.lower().startswith('answer:'):
+        if answer_lower.startswith('answer:'):
             answer = answer[7:].strip()
-        
+            answer_lower = answer.lower()
+
         # Handle common model responses
-        if answer.lower() in ['', 'none', 'n/a', 'not applicable']:
+        if answer_lower in _EMPTY_ANSWERS:
             return "Not found in video."
         
         # Ensure proper capitalization
@@ -198,32 +358,59 @@ class QAAgent:
         """
         question_lower = question.lower()
 
-        # Simple keyword-based responses
-        if any(word in question_lower for word in ['what', 'define', 'explain']):
-            if 'machine learning' in question_lower:
-                return "Machine learning is a subset of artificial intelligence that enables computers to learn from data."
-            elif 'supervised' in question_lower:
-                return "Supervised learning uses labeled data to train models to make predictions."
-            elif 'neural network' in question_lower:
-                return "Neural networks are computing systems inspired by biological neural networks."
-            else:
-                return "This concept is explained in the video content with relevant examples."
+        # One pass classifies the question; the group name picks the answer
+        match = _OFFLINE_KEYWORD_PATTERN.search(question_lower)
+        category = match.lastgroup if match else None
+
+        if category == 'what':
+            for topic, answer in _OFFLINE_TOPIC_ANSWERS:
+                if topic in question_lower:
+                    return answer
 
-        elif any(word in question_lower for word in ['how', 'process', 'work']):
-            return "The process involves multiple steps as described in the video, including data preparation and model training."
+        return _OFFLINE_CATEGORY_ANSWERS[category]
+
+    def _retrieve(
+        self,
+        question: str,
+        query_embedding: np.ndarray,
+        similarity_threshold: float,
+        top_k: int
+    ) -> List[Tuple[TranscriptChunk, float]]:
+        """
+        Retrieve chunks ranked by similarity to the embedded question.
 
-        elif any(word in question_lower for word in ['why', 'reason', 'benefit']):
-            return "This approach is beneficial because it provides accurate results and is widely applicable."
+        Args:
+            question: User question
+            query_embedding: L2-normalized question embedding
+            similarity_threshold: Minimum similarity threshold
+            top_k: Number of chunks to retrieve
 
-        elif any(word in question_lower for word in ['when', 'time', 'use']):
-            return "This technique is typically used when you have sufficient data and clear objectives."
+        Returns:
+            List of (chunk, similarity_score) tuples, best first
+        """
+        if self._faiss_index is not None:
+            query_vec = np.ascontiguousarray(
+                query_embedding[np.newaxis, :], dtype=np.float32
+            )
+            scores, indices = self._faiss_index.search(query_vec, top_k)
+            return [
+                (self.chunks[i], float(score))
+                for score, i in zip(scores[0], indices[0])
+                if i >= 0 and score >= similarity_threshold
+            ]
 
-        else:
-            return "Based on the video content, this topic is covered with practical examples and explanations."
+        return self.retriever.find_similar_chunks(
+            query=question,
+            chunks=self.chunks,
+            chunk_embeddings=self.chunk_embeddings,
+            top_k=top_k,
+            threshold=similarity_threshold,
+            query_embedding=query_embedding
+        )
 
     def answer_question(
-        self, 
-        question: str, 
+        self,
+        question: str,
         similarity_threshold: float = None,
         top_k: int = None
     ) -> Tuple[str, List[str]]:
@@ -238,22 +425,29 @@ class QAAgent:
         Returns:
             Tuple of (answer, citations)
         """
-        if not self.chunks or not self.chunk_embeddings:
+        if not self.chunks or len(self.chunk_embeddings) == 0:
             return "No content has been indexed for Q&A.", []
         
         similarity_threshold = similarity_threshold or Config.SIMILARITY_THRESHOLD
         top_k = top_k or Config.TOP_K_CHUNKS
         
         try:
-            # Retrieve relevant chunks
-            similar_chunks = self.retriever.find_similar_chunks(
-                query=question,
-                chunks=self.chunks,
-                chunk_embeddings=self.chunk_embeddings,
-                top_k=top_k,
-                threshold=similarity_threshold
+            # Embed the question once; the semantic cache and retrieval
+            # both work from this vector
+            query_embedding = self.retriever.get_embedding(question)
+            norm = np.linalg.norm(query_embedding)
+            if norm > 0:
+                query_embedding = query_embedding / norm
+
+            cached = self._semantic_cache_lookup(query_embedding)
+            if cached is not None:
+                return cached
+
+            similar_chunks = self._retrieve(
+                question, query_embedding, similarity_threshold, top_k
             )
-            
+
+
             if not similar_chunks:
                 logger.info(f"No chunks found above threshold {similarity_threshold}")
                 return "Not found in video.", []
@@ -284,12 +478,119 @@ class QAAgent:
                     answer += citation_text
             
             logger.info(f"Answered question with {len(similar_chunks)} relevant chunks")
+            self._semantic_cache_store(query_embedding, answer, citations)
             return answer, citations
             
         except Exception as e:
             logger.error(f"Failed to answer question: {e}")
             return "I encountered an error while processing your question.", []
     
+    def answer_question_stream(
+        self,
+        question: str,
+        similarity_threshold: float = None,
+        top_k: int = None
+    ):
+        """
+        Answer a question, yielding answer fragments as they arrive.
+
+        Retrieval, the semantic cache, and citation bookkeeping match
+        answer_question; only generation is streamed, so a UI can render
+        tokens as they come instead of blocking on the full answer.
+        Citations for the streamed answer are left on self.last_citations
+        once the stream is consumed.
+
+        Args:
+            question: User question
+            similarity_threshold: Minimum similarity threshold for retrieval
+            top_k: Number of top chunks to retrieve
+
+        Yields:
+            Answer text fragments in generation order
+        """
+        self.last_citations = []
+
+        if not self.chunks or len(self.chunk_embeddings) == 0:
+            yield "No content has been indexed for Q&A."
+            return
+
+        similarity_threshold = similarity_threshold or Config.SIMILARITY_THRESHOLD
+        top_k = top_k or Config.TOP_K_CHUNKS
+
+        try:
+            query_embedding = self.retriever.get_embedding(question)
+            norm = np.linalg.norm(query_embedding)
+            if norm > 0:
+                query_embedding = query_embedding / norm
+
+            cached = self._semantic_cache_lookup(query_embedding)
+            if cached is not None:
+                answer, citations = cached
+                self.last_citations = citations
+                yield answer
+                return
+
+            similar_chunks = self._retrieve(
+                question, query_embedding, similarity_threshold, top_k
+            )
+
+            if not similar_chunks or similar_chunks[0][1] < similarity_threshold:
+                yield "Not found in video."
+                return
+
+            context = self.retriever.prepare_context(similar_chunks)
+            if not context:
+                yield "Not found in video."
+                return
+
+            self.last_citations = [
+                chunk.get_citation() for chunk, _ in similar_chunks
+            ]
+
+            fragments = []
+            for fragment in self.generate_answer_stream(question, context):
+                fragments.append(fragment)
+                yield fragment
+
+            answer = self.clean_answer(''.join(fragments).strip())
+            self._semantic_cache_store(query_embedding, answer, self.last_citations)
+
+        except Exception as e:
+            logger.error(f"Failed to answer question: {e}")
+            yield "I encountered an error while processing your question."
+
+    def answer_question_batch(
+        self,
+        questions: List[str],
+        similarity_threshold: float = None,
+        top_k: int = None,
+        max_workers: int = 8
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Answer several questions concurrently.
+
+        Each question still issues its own generation request, but the
+        requests run in parallel worker threads so their network and
+        inference latency overlaps and the server-side batcher stays fed.
+
+        Args:
+            questions: User questions
+            similarity_threshold: Minimum similarity threshold for retrieval
+            top_k: Number of top chunks to retrieve
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            List of (answer, citations) tuples, in input order
+        """
+        if not questions:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(questions))) as pool:
+            return list(pool.map(
+                lambda q: self.answer_question(q, similarity_threshold, top_k),
+                questions
+            ))
+
     def translate_to_english(self, text: str, source_language: str = "auto") -> str:
         """
         Translate text to English using the QA model (simple approach).
@@ -313,8 +614,7 @@ class QAAgent:
                     prompt=prompt,
                     model=Config.QA_MODEL,
                     max_new_tokens=len(text) + 100,
-                    temperature=0.1,
-                    do_sample=True,
+                    do_sample=False,
                     return_full_text=False
                 )
                 return response
@@ -337,8 +637,12 @@ class QAAgent:
             return text  # Return original on failure
     
     def clear_index(self) -> None:
-        """Clear the indexed chunks and embeddings."""
+        """Clear the indexed chunks, embeddings, and semantic answer cache."""
         self.chunks = []
-        self.chunk_embeddings = []
+        self.chunk_embeddings = np.empty((0, 0), dtype=np.float32)
+        self._faiss_index = None
+        with self._semantic_cache_lock:
+            self._semantic_cache = []
+            self._semantic_cache_matrix = None
         self.retriever.clear_cache()
         logger.info("Cleared Q&A index")
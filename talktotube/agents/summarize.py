@@ -1,40 +1,69 @@
 """Summarization agent using BART via HuggingFace Inference API."""
 
+import hashlib
+import io
 import logging
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
-from huggingface_hub import InferenceClient
+import diskcache
 
 from ..config import Config
 from ..utils.text import TranscriptChunk
+from ..utils.hf_parse import extract_text
+from ..utils.retry import rate_limit_retry
+from ._client import get_client
 
 logger = logging.getLogger(__name__)
 
+# Content-addressed summary cache: the same prepared text, prompt, and
+# model always produce the same request, so repeat summarizations skip the
+# BART round-trip entirely
+_summary_cache = diskcache.Cache(Config.SUMMARY_CACHE_DIR)
+
+
+# Lines echoing the prompt back, folded into one compiled alternation so
+# filtering is a single C-level scan per line
+_PROMPT_ARTIFACT_PHRASES = (
+    'summarize the following',
+    'transcript:',
+    'key bullet points',
+    'include timestamps',
+)
+_PROMPT_ARTIFACT_PATTERN = re.compile(
+    '|'.join(map(re.escape, _PROMPT_ARTIFACT_PHRASES)), re.IGNORECASE
+)
+
+# Sentence splitter for bullet fallback: one C-level pass that keeps the
+# terminator and handles '!'/'?', unlike str.split('.')
+_SENTENCE_PATTERN = re.compile(r'[^.!?]+[.!?]+')
+
+# Character budget per map-stage request when summarizing chunked
+# transcripts; transcripts under this go through a single request as before
+_PARTITION_LIMIT = 6000
+
+# Bullet-line detection: each prefix tuple is one C-level startswith call
+# instead of per-character isdigit/slice scans
+_BULLET_PREFIXES = ('•', '-', '*')
+_NUMBERED_PREFIXES = tuple(f"{i}." for i in range(1, 10))
+
+
+def _summary_cache_key(prepared_text: str, prompt: str) -> str:
+    """Build the content hash key for a summarization request."""
+    payload = "\x00".join((prepared_text, prompt, Config.SUMMARIZATION_MODEL))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
 
 class SummarizationAgent:
     """Handles text summarization using BART model."""
     
     def __init__(self):
         """Initialize the summarization agent."""
-        self.client = InferenceClient(token=Config.HUGGINGFACE_API_TOKEN)
+        self.client = get_client()
     
     def rate_limit_retry(self, func, *args, **kwargs) -> Any:
-        """Execute function with exponential backoff retry."""
-        last_exception = None
-        
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                if attempt < Config.MAX_RETRIES - 1:
-                    wait_time = Config.RETRY_BACKOFF_SECONDS[attempt]
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"All {Config.MAX_RETRIES} attempts failed")
-        
-        raise last_exception
+        """Execute function with jittered exponential backoff retry."""
+        return rate_limit_retry(func, *args, **kwargs)
     
     def prepare_text_for_summarization(self, transcript_text: str, max_length: int = 4000) -> str:
         """
@@ -50,15 +79,13 @@ class SummarizationAgent:
         if len(transcript_text) <= max_length:
             return transcript_text
         
-        # Truncate at sentence boundary if possible
+        # Truncate at sentence boundary if possible — three C-level rfind
+        # scans over the bounded slice beat a regex pass
         truncated = transcript_text[:max_length]
-        last_period = truncated.rfind('.')
-        last_exclamation = truncated.rfind('!')
-        last_question = truncated.rfind('?')
-        
-        # Find the last sentence ending
-        last_sentence_end = max(last_period, last_exclamation, last_question)
-        
+        last_sentence_end = max(
+            truncated.rfind('.'), truncated.rfind('!'), truncated.rfind('?')
+        )
+
         if last_sentence_end > max_length * 0.8:  # If we can keep at least 80% of content
             truncated = truncated[:last_sentence_end + 1]
         
@@ -87,7 +114,16 @@ class SummarizationAgent:
         
         # Use custom prompt or default
         prompt = custom_prompt or Config.SUMMARY_PROMPT
-        
+
+        # Same text + prompt + model means the same summary — serve repeats
+        # from the disk cache
+        cache_key = _summary_cache_key(prepared_text, prompt)
+        if not Config.NO_CACHE:
+            cached = _summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached summary")
+                return cached
+
         # Combine prompt with text
         full_input = f"{prompt}\n\nTranscript:\n{prepared_text}"
         
@@ -96,8 +132,7 @@ class SummarizationAgent:
                 prompt=full_input,
                 model=Config.SUMMARIZATION_MODEL,
                 max_new_tokens=500,
-                temperature=0.3,
-                do_sample=True,
+                do_sample=False,
                 return_full_text=False
             )
             return response
@@ -114,42 +149,20 @@ class SummarizationAgent:
                 result = self.rate_limit_retry(_summarize)
             
             # Extract summary from response - handle multiple formats
-            summary = "Failed to generate summary."
-
             try:
-                if isinstance(result, str):
-                    summary = result.strip()
-                elif isinstance(result, dict):
-                    if 'generated_text' in result:
-                        summary = result['generated_text'].strip()
-                    elif 'text' in result:
-                        summary = result['text'].strip()
-                    elif len(result) == 1:
-                        # Single key-value pair
-                        summary = str(list(result.values())[0]).strip()
-                    else:
-                        summary = str(result).strip()
-                elif isinstance(result, list) and len(result) > 0:
-                    first_item = result[0]
-                    if isinstance(first_item, dict):
-                        if 'generated_text' in first_item:
-                            summary = first_item['generated_text'].strip()
-                        elif 'text' in first_item:
-                            summary = first_item['text'].strip()
-                        else:
-                            summary = str(first_item).strip()
-                    else:
-                        summary = str(first_item).strip()
-                else:
-                    logger.warning(f"Unexpected summarization response format: {type(result)} - {result}")
-                    summary = "Could not parse summary from API response."
+                summary = extract_text(result).strip()
             except Exception as parse_error:
                 logger.error(f"Error parsing summary response: {parse_error}")
                 summary = "Error parsing summary response."
-            
+
             # Clean up summary
             summary = self.clean_summary(summary)
-            
+
+            if not Config.NO_CACHE:
+                _summary_cache.set(
+                    cache_key, summary, expire=Config.SUMMARY_CACHE_TTL_SECONDS
+                )
+
             logger.info(f"Generated summary ({len(summary)} characters)")
             return summary
             
@@ -214,12 +227,7 @@ class SummarizationAgent:
                 continue
             
             # Skip lines that look like prompt repetition
-            if any(phrase in line.lower() for phrase in [
-                'summarize the following',
-                'transcript:',
-                'key bullet points',
-                'include timestamps'
-            ]):
+            if _PROMPT_ARTIFACT_PATTERN.search(line):
                 continue
             
             cleaned_lines.append(line)
@@ -230,9 +238,9 @@ class SummarizationAgent:
         # Ensure bullet points
         if summary and not any(line.strip().startswith(('•', '-', '*', '1.', '2.')) for line in summary.split('\n')):
             # Convert to bullet points if not already formatted
-            sentences = [s.strip() for s in summary.split('.') if s.strip()]
+            sentences = [s.strip() for s in _SENTENCE_PATTERN.findall(summary) if s.strip()]
             if len(sentences) > 1:
-                summary = '\n'.join(f"• {sentence}." for sentence in sentences[:8])
+                summary = '\n'.join(f"• {sentence}" for sentence in sentences[:8])
         
         return summary
     
@@ -248,23 +256,48 @@ class SummarizationAgent:
         """
         if not chunks:
             return "No content to summarize."
-        
-        # Combine chunks into text with timestamps
-        text_parts = []
+
+        # Combine chunks into text with timestamps, writing straight into
+        # one buffer instead of building a parts list and joining it
+        # (which holds two full copies of the transcript at peak).
+        # Partition at _PARTITION_LIMIT characters so long transcripts
+        # map to several model-sized requests instead of one oversized one
+        partitions: List[str] = []
+        buf = io.StringIO()
+        write = buf.write
+        size = 0
         for chunk in chunks:
-            timestamp = chunk.get_citation()
-            text_parts.append(f"{timestamp} {chunk.text}")
-        
-        combined_text = '\n'.join(text_parts)
-        
+            line = f"{chunk.get_citation()} {chunk.text}\n"
+            if size and size + len(line) > _PARTITION_LIMIT:
+                partitions.append(buf.getvalue()[:-1])
+                buf = io.StringIO()
+                write = buf.write
+                size = 0
+            write(line)
+            size += len(line)
+        partitions.append(buf.getvalue()[:-1])
+
         # Create custom prompt that emphasizes timestamps
         custom_prompt = (
             "Summarize the following timestamped transcript into 5–8 key bullet points. "
             "Include relevant timestamps in your summary. Keep it concise and factual. "
             "Format each point as a bullet point."
         )
-        
-        return self.summarize_text(combined_text, custom_prompt)
+
+        if len(partitions) == 1:
+            return self.summarize_text(partitions[0], custom_prompt)
+
+        # Map stage: the per-partition requests are I/O-bound HTTP calls,
+        # so running them concurrently overlaps their latencies
+        with ThreadPoolExecutor(max_workers=min(4, len(partitions))) as pool:
+            partials = list(pool.map(
+                lambda text: self.summarize_text(text, custom_prompt),
+                partitions,
+            ))
+
+        # Reduce stage: summarize the partial summaries into one result,
+        # keeping the same timestamped bullet format
+        return self.summarize_text("\n".join(partials), custom_prompt)
     
     def create_bullet_summary(self, transcript_text: str) -> List[str]:
         """
@@ -278,24 +311,31 @@ class SummarizationAgent:
         """
         summary = self.summarize_text(transcript_text)
         
-        # Split into bullet points
+        # Split into bullet points, deduplicating by prefix in O(1) per line
         lines = summary.split('\n')
         bullet_points = []
-        
+        seen_prefixes = set()
+
         for line in lines:
             line = line.strip()
             if not line:
                 continue
-            
+
             # Clean up bullet point formatting
-            if line.startswith(('•', '-', '*')):
+            if line.startswith(_BULLET_PREFIXES):
                 bullet_points.append(line)
-            elif line[0].isdigit() and '.' in line[:3]:
-                # Convert numbered list to bullets
-                bullet_points.append('• ' + line.split('.', 1)[1].strip())
-            elif line and not any(line.startswith(bp[:10]) for bp in bullet_points):
+                seen_prefixes.add(line[:10])
+            elif line.startswith(_NUMBERED_PREFIXES):
+                # Convert numbered list to bullets; split once and reuse
+                rest = line.split('.', 1)[1].strip()
+                bullet = '• ' + rest
+                bullet_points.append(bullet)
+                seen_prefixes.add(bullet[:10])
+            elif ('• ' + line)[:10] not in seen_prefixes:
                 # Add bullet if not already present and not duplicate
-                bullet_points.append('• ' + line)
+                bullet = '• ' + line
+                bullet_points.append(bullet)
+                seen_prefixes.add(bullet[:10])
         
         # Limit to reasonable number of points
         return bullet_points[:8]
@@ -1,43 +1,101 @@
 """Fallback transcription agent using yt-dlp and Whisper via HuggingFace."""
 
+import glob
+import io
 import logging
 import os
+import shutil
+import subprocess
 import tempfile
 import time
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
 import yt_dlp
-from huggingface_hub import InferenceClient
 
 from ..config import Config
+from ..utils.retry import rate_limit_retry
+from ._client import get_client
 
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Segment length for the overlapped download/transcribe pipeline
+_SEGMENT_SECONDS = 30
+
 
 class TranscriptionAgent:
     """Handles audio download and transcription as fallback when transcripts aren't available."""
-    
+
     def __init__(self):
         """Initialize the transcription agent."""
-        self.client = InferenceClient(token=Config.HUGGINGFACE_API_TOKEN)
+        self.client = get_client()
         self.temp_dir = tempfile.gettempdir()
+
+        # Lazily constructed faster-whisper model, used when
+        # Config.WHISPER_BACKEND selects in-process transcription
+        self._local_model = None
+        self._batched = False
+        self._detected_language: Optional[str] = None
+
+        # One yt-dlp instance for the agent's lifetime; per-call bits
+        # (output template, duration limit) are updated in download_audio
+        self._max_duration = 3600
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'outtmpl': os.path.join(self.temp_dir, 'talktotube_audio.%(ext)s'),
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'wav',
+                'preferredquality': '192',
+            }],
+            # Whisper works on 16 kHz mono; emitting it directly cuts the
+            # WAV ~4-6x and skips the in-pipeline resample pass
+            'postprocessor_args': ['-ac', '1', '-ar', '16000'],
+            'quiet': not Config.DEBUG,
+            'no_warnings': not Config.DEBUG,
+            'extractaudio': True,
+            'audioformat': 'wav',
+            'match_filter': lambda info_dict: None if info_dict.get('duration', 0) <= self._max_duration else "Video too long",
+            # Additional options to bypass restrictions
+            'user_agent': _USER_AGENT,
+            'referer': 'https://www.youtube.com/',
+            'extractor_retries': 3,
+            'fragment_retries': 3,
+            'skip_unavailable_fragments': True,
+        }
+        self._ydl = yt_dlp.YoutubeDL(ydl_opts)
+
+    def _get_local_model(self):
+        """
+        Load the faster-whisper model on first use.
+
+        Long-form audio goes through BatchedInferencePipeline where the
+        installed faster-whisper provides it, so 30-second windows run as
+        one batched forward pass instead of sequentially.
+
+        Returns:
+            BatchedInferencePipeline when available, else a plain WhisperModel
+        """
+        if self._local_model is None:
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                Config.WHISPER_MODEL_SIZE, device="cpu", compute_type="int8"
+            )
+
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                self._local_model = model
+            else:
+                self._local_model = BatchedInferencePipeline(model=model)
+                self._batched = True
+        return self._local_model
     
     def rate_limit_retry(self, func, *args, **kwargs) -> Any:
-        """Execute function with exponential backoff retry."""
-        last_exception = None
-        
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                if attempt < Config.MAX_RETRIES - 1:
-                    wait_time = Config.RETRY_BACKOFF_SECONDS[attempt]
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"All {Config.MAX_RETRIES} attempts failed")
-        
-        raise last_exception
+        """Execute function with jittered exponential backoff retry."""
+        return rate_limit_retry(func, *args, **kwargs)
     
     def download_audio(self, url: str, max_duration: int = 3600) -> str:
         """
@@ -55,69 +113,51 @@ class TranscriptionAgent:
         """
         # Create temporary filename
         temp_audio_path = os.path.join(self.temp_dir, f"talktotube_audio_{int(time.time())}.wav")
-        
-        # yt-dlp options for audio extraction
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': temp_audio_path.replace('.wav', '.%(ext)s'),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-                'preferredquality': '192',
-            }],
-            'quiet': not Config.DEBUG,
-            'no_warnings': not Config.DEBUG,
-            'extractaudio': True,
-            'audioformat': 'wav',
-            'match_filter': lambda info_dict: None if info_dict.get('duration', 0) <= max_duration else "Video too long",
-            # Additional options to bypass restrictions
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'referer': 'https://www.youtube.com/',
-            'extractor_retries': 3,
-            'fragment_retries': 3,
-            'skip_unavailable_fragments': True,
-        }
-        
+
+        # Point the shared yt-dlp instance at this call's output file and
+        # duration limit; match_filter reads the limit through self
+        self._max_duration = max_duration
+        self._ydl.params['outtmpl']['default'] = temp_audio_path.replace('.wav', '.%(ext)s')
+
         try:
             logger.info(f"Downloading audio from: {url}")
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    # Extract info first to check duration
-                    info = ydl.extract_info(url, download=False)
-                    duration = info.get('duration', 0)
-                    title = info.get('title', 'Unknown')
-
-                    logger.info(f"Video: {title}, Duration: {duration}s")
-
-                    if duration > max_duration:
-                        raise ValueError(f"Video too long: {duration}s (max: {max_duration}s)")
-
-                    # Download the audio
-                    ydl.download([url])
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if 'sign in' in error_msg or 'bot' in error_msg:
-                        raise ValueError("This video requires sign-in or has bot protection. Please try a different video.")
-                    elif 'private' in error_msg or 'unavailable' in error_msg:
-                        raise ValueError("This video is private or unavailable. Please try a different video.")
-                    elif 'age' in error_msg:
-                        raise ValueError("This video is age-restricted. Please try a different video.")
-                    else:
-                        raise
+            try:
+                # One call fetches metadata and downloads; the match_filter
+                # rejects over-long videos before any bytes transfer, so no
+                # separate extract_info(download=False) round trip is needed
+                info = self._ydl.extract_info(url, download=True)
+                duration = info.get('duration', 0)
+                title = info.get('title', 'Unknown')
+
+                logger.info(f"Video: {title}, Duration: {duration}s")
+
+                if duration > max_duration:
+                    raise ValueError(f"Video too long: {duration}s (max: {max_duration}s)")
+            except Exception as e:
+                error_msg = str(e).lower()
+                if 'sign in' in error_msg or 'bot' in error_msg:
+                    raise ValueError("This video requires sign-in or has bot protection. Please try a different video.")
+                elif 'private' in error_msg or 'unavailable' in error_msg:
+                    raise ValueError("This video is private or unavailable. Please try a different video.")
+                elif 'age' in error_msg:
+                    raise ValueError("This video is age-restricted. Please try a different video.")
+                else:
+                    raise
             
-            # Find the actual downloaded file (yt-dlp might change extension)
+            # Find the actual downloaded file (yt-dlp might change
+            # extension): one glob scan instead of an exists() probe per
+            # candidate extension, then preference order picks the winner
             base_path = temp_audio_path.replace('.wav', '')
-            possible_extensions = ['.wav', '.m4a', '.mp3', '.webm']
-            
+            candidates = {Path(p).suffix: p for p in glob.iglob(f"{base_path}.*")}
+
             actual_path = None
-            for ext in possible_extensions:
-                test_path = base_path + ext
-                if os.path.exists(test_path):
-                    actual_path = test_path
+            for ext in ('.wav', '.m4a', '.mp3', '.webm'):
+                if ext in candidates:
+                    actual_path = candidates[ext]
                     break
-            
-            if not actual_path or not os.path.exists(actual_path):
+
+            if not actual_path:
                 raise FileNotFoundError("Downloaded audio file not found")
             
             file_size = os.path.getsize(actual_path)
@@ -127,40 +167,200 @@ class TranscriptionAgent:
             
         except Exception as e:
             logger.error(f"Failed to download audio: {e}")
-            # Clean up any partial files
-            for ext in ['.wav', '.m4a', '.mp3', '.webm']:
-                test_path = temp_audio_path.replace('.wav', ext)
-                if os.path.exists(test_path):
-                    try:
-                        os.remove(test_path)
-                    except:
-                        pass
+            # Clean up any partial files in one pass; unlink(missing_ok)
+            # tolerates files vanishing between the scan and the delete
+            for stray in glob.iglob(temp_audio_path.replace('.wav', '.*')):
+                try:
+                    Path(stray).unlink(missing_ok=True)
+                except OSError:
+                    pass
             raise
-    
-    def transcribe_audio(self, audio_path: str) -> List[Dict[str, Any]]:
+
+    def _resolve_audio_url(self, url: str, max_duration: int) -> str:
+        """
+        Resolve the direct audio stream URL for a video.
+
+        Args:
+            url: YouTube video URL
+            max_duration: Maximum duration in seconds
+
+        Returns:
+            Direct URL of the best audio stream
+
+        Raises:
+            ValueError: If the video is too long or has no audio stream
+        """
+        self._max_duration = max_duration
+
+        info = self._ydl.extract_info(url, download=False)
+        duration = info.get('duration', 0)
+
+        if duration > max_duration:
+            raise ValueError(f"Video too long: {duration}s (max: {max_duration}s)")
+
+        # Prefer an audio-only format; fall back to anything with audio
+        audio_url = None
+        best_bitrate = -1.0
+        for fmt in info.get('formats', []):
+            if not fmt.get('url') or fmt.get('acodec') in (None, 'none'):
+                continue
+            is_audio_only = fmt.get('vcodec') == 'none'
+            bitrate = (fmt.get('abr') or 0) + (1e6 if is_audio_only else 0)
+            if bitrate > best_bitrate:
+                best_bitrate = bitrate
+                audio_url = fmt['url']
+
+        if not audio_url:
+            raise ValueError("No audio stream found for video")
+
+        return audio_url
+
+    def download_audio_bytes(self, url: str, max_duration: int = 3600) -> bytes:
+        """
+        Stream audio into memory as 16 kHz mono WAV, skipping the tempfile.
+
+        Resolves the direct audio stream URL from video metadata and pipes
+        ffmpeg straight into a bytes buffer, so the tempfile write and
+        re-read (2x the file size of disk I/O) never happen.
+
+        Args:
+            url: YouTube video URL
+            max_duration: Maximum duration in seconds
+
+        Returns:
+            WAV audio as bytes
+
+        Raises:
+            Exception: If resolution or conversion fails
+        """
+        logger.info(f"Streaming audio from: {url}")
+
+        audio_url = self._resolve_audio_url(url, max_duration)
+
+        result = subprocess.run(
+            [
+                'ffmpeg', '-v', 'error',
+                '-user_agent', _USER_AGENT,
+                '-i', audio_url,
+                '-ac', '1', '-ar', '16000',
+                '-f', 'wav', 'pipe:1',
+            ],
+            capture_output=True,
+            check=True,
+        )
+
+        logger.info(f"Streamed audio into memory ({len(result.stdout)} bytes)")
+        return result.stdout
+
+    def _transcribe_from_url_segmented(self, url: str, max_duration: int) -> List[Dict[str, Any]]:
+        """
+        Overlap download and local transcription with 30-second segments.
+
+        ffmpeg acts as the producer, writing numbered WAV segments as the
+        stream downloads; the consumer transcribes each segment as soon
+        as the next one appears (proving the previous is complete), so
+        ASR compute runs while later audio is still in flight. Wall time
+        approaches max(download, transcribe) instead of their sum.
+
+        Args:
+            url: YouTube video URL
+            max_duration: Maximum duration in seconds
+
+        Returns:
+            List of transcript segments with absolute timestamps
+        """
+        audio_url = self._resolve_audio_url(url, max_duration)
+
+        seg_dir = tempfile.mkdtemp(prefix='talktotube_seg_')
+        pattern = os.path.join(seg_dir, 'seg_%05d.wav')
+
+        proc = subprocess.Popen(
+            [
+                'ffmpeg', '-v', 'error',
+                '-user_agent', _USER_AGENT,
+                '-i', audio_url,
+                '-ac', '1', '-ar', '16000',
+                '-f', 'segment', '-segment_time', str(_SEGMENT_SECONDS),
+                pattern,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        transcript_data: List[Dict[str, Any]] = []
+        index = 0
+
+        try:
+            while True:
+                path = os.path.join(seg_dir, f'seg_{index:05d}.wav')
+                next_path = os.path.join(seg_dir, f'seg_{index + 1:05d}.wav')
+
+                if not os.path.exists(next_path):
+                    if proc.poll() is None:
+                        # Producer still writing this segment — wait
+                        time.sleep(0.2)
+                        continue
+                    if not os.path.exists(path):
+                        break  # producer done and no more segments
+
+                # Segment is complete: the producer moved past it or exited
+                offset = index * _SEGMENT_SECONDS
+                for segment in self._transcribe_local(path):
+                    segment['start'] += offset
+                    transcript_data.append(segment)
+
+                os.remove(path)
+                index += 1
+
+            if proc.wait() != 0:
+                raise RuntimeError(f"ffmpeg segmenter exited with code {proc.returncode}")
+
+            return transcript_data
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+            shutil.rmtree(seg_dir, ignore_errors=True)
+
+    def transcribe_audio(self, audio: Union[str, bytes]) -> List[Dict[str, Any]]:
         """
         Transcribe audio using Whisper via HuggingFace Inference API.
-        
+
         Args:
-            audio_path: Path to audio file
-            
+            audio: Path to an audio file, or raw WAV bytes
+
         Returns:
             List of transcript segments with timestamps
-            
+
         Raises:
             Exception: If transcription fails
         """
-        def _transcribe():
-            with open(audio_path, 'rb') as audio_file:
-                response = self.client.automatic_speech_recognition(
-                    audio_file.read(),
-                    model=Config.WHISPER_MODEL
+        # In-process transcription when the local backend is configured —
+        # no audio upload, and CTranslate2's int8 kernels beat the remote
+        # round-trip by a wide margin on repeat use
+        if Config.WHISPER_BACKEND != 'api':
+            try:
+                return self._transcribe_local(audio)
+            except Exception as e:
+                logger.warning(
+                    f"Local Whisper backend failed ({e}); "
+                    f"falling back to Inference API"
                 )
-            return response
-        
+
+        def _transcribe():
+            if isinstance(audio, bytes):
+                audio_bytes = audio
+            else:
+                with open(audio, 'rb') as audio_file:
+                    audio_bytes = audio_file.read()
+            return self.client.automatic_speech_recognition(
+                audio_bytes,
+                model=Config.WHISPER_MODEL
+            )
+
         try:
-            logger.info(f"Transcribing audio: {audio_path}")
-            
+            logger.info("Transcribing audio...")
+
             # Call Whisper API with retry
             result = self.rate_limit_retry(_transcribe)
             
@@ -200,7 +400,37 @@ class TranscriptionAgent:
         except Exception as e:
             logger.error(f"Failed to transcribe audio: {e}")
             raise
-    
+
+    def _transcribe_local(self, audio: Union[str, bytes]) -> List[Dict[str, Any]]:
+        """
+        Transcribe audio in-process with faster-whisper.
+
+        Args:
+            audio: Path to an audio file, or raw WAV bytes
+
+        Returns:
+            List of transcript segments with timestamps
+        """
+        logger.info("Transcribing audio locally...")
+
+        source = io.BytesIO(audio) if isinstance(audio, bytes) else audio
+        model = self._get_local_model()
+        kwargs = {'beam_size': 1, 'vad_filter': True}
+        if self._batched:
+            kwargs['batch_size'] = Config.ASR_BATCH_SIZE
+        segments, info = model.transcribe(source, **kwargs)
+
+        self._detected_language = info.language
+
+        return [
+            {
+                'text': segment.text.strip(),
+                'start': segment.start,
+                'duration': segment.end - segment.start,
+            }
+            for segment in segments
+        ]
+
     def cleanup_audio_file(self, audio_path: str) -> None:
         """
         Clean up temporary audio file.
@@ -209,9 +439,10 @@ class TranscriptionAgent:
             audio_path: Path to audio file to delete
         """
         try:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-                logger.debug(f"Cleaned up audio file: {audio_path}")
+            # missing_ok folds the exists() check into the unlink — one
+            # filesystem call, and no race if the file is already gone
+            Path(audio_path).unlink(missing_ok=True)
+            logger.debug(f"Cleaned up audio file: {audio_path}")
         except Exception as e:
             logger.warning(f"Failed to clean up audio file {audio_path}: {e}")
     
@@ -229,18 +460,41 @@ class TranscriptionAgent:
         Raises:
             Exception: If any step fails
         """
+        # Local backend: overlap download and transcription per segment
+        if Config.WHISPER_BACKEND != 'api':
+            try:
+                transcript_data = self._transcribe_from_url_segmented(url, max_duration)
+                logger.info(f"Successfully transcribed {len(transcript_data)} segments")
+                return transcript_data
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.warning(f"Segmented transcription failed ({e}); falling back")
+
+        # Stream into memory when possible — no tempfile write/read/delete
+        try:
+            audio_bytes = self.download_audio_bytes(url, max_duration)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.warning(f"In-memory audio streaming failed ({e}); falling back to file download")
+        else:
+            transcript_data = self.transcribe_audio(audio_bytes)
+            logger.info(f"Successfully transcribed {len(transcript_data)} segments")
+            return transcript_data
+
         audio_path = None
-        
+
         try:
             # Download audio
             audio_path = self.download_audio(url, max_duration)
-            
+
             # Transcribe
             transcript_data = self.transcribe_audio(audio_path)
-            
+
             logger.info(f"Successfully transcribed {len(transcript_data)} segments")
             return transcript_data
-            
+
         finally:
             # Always clean up
             if audio_path:
@@ -256,7 +510,8 @@ class TranscriptionAgent:
         Returns:
             Language code (defaults to 'en')
         """
-        # For now, assume English
-        # In a full implementation, you could use language detection
-        # or check Whisper's language detection output
+        # The local backend records Whisper's own language detection;
+        # the API path doesn't expose it, so assume English there
+        if self._detected_language:
+            return self._detected_language
         return 'en'
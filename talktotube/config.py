@@ -20,12 +20,45 @@ class Config:
 
     # Offline mode for testing without API calls
     OFFLINE_MODE: bool = os.getenv("TALKTOTUBE_OFFLINE", "false").lower() == "true"
+
+    # Transcript caching (set TALKTOTUBE_NO_CACHE=true to always hit the network)
+    NO_CACHE: bool = os.getenv("TALKTOTUBE_NO_CACHE", "false").lower() == "true"
+    TRANSCRIPT_CACHE_DIR: str = os.getenv("TALKTOTUBE_CACHE_DIR", ".cache/transcripts")
+    TRANSCRIPT_CACHE_TTL_SECONDS: int = 7 * 86400  # 1 week
+    METADATA_CACHE_DIR: str = os.getenv("TALKTOTUBE_META_CACHE_DIR", ".cache/meta")
+    METADATA_CACHE_TTL_SECONDS: int = 86400  # 1 day
+    SUMMARY_CACHE_DIR: str = os.getenv("TALKTOTUBE_SUMMARY_CACHE_DIR", ".cache/summaries")
+    SUMMARY_CACHE_TTL_SECONDS: int = 7 * 86400  # 1 week
+    PIPELINE_CACHE_DIR: str = os.getenv("TALKTOTUBE_PIPELINE_CACHE_DIR", ".cache/pipeline")
+    EMBEDDING_CACHE_DIR: str = os.getenv("TALKTOTUBE_EMBEDDING_CACHE_DIR", ".cache/embeddings")
     
     # Model Configuration
     WHISPER_MODEL: str = "openai/whisper-small"
+    WHISPER_MODEL_SIZE: str = os.getenv("TALKTOTUBE_WHISPER_SIZE", "small")
     SUMMARIZATION_MODEL: str = "facebook/bart-large-cnn"
     QA_MODEL: str = "google/flan-t5-base"
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+
+    # Embedding backend: "api" (HuggingFace Inference API, default), or
+    # "local" / "onnx" / "openvino" to run sentence-transformers in-process.
+    # The onnx/openvino values are passed through as the encoder backend for
+    # faster CPU inference where the installed version supports it.
+    EMBEDDING_BACKEND: str = os.getenv("TALKTOTUBE_EMBEDDING_BACKEND", "api")
+
+    # Texts sent per feature_extraction request when embedding via the API
+    EMBED_BATCH_SIZE: int = 32
+
+    # Maximum entries kept in the in-process embedding cache; least
+    # recently used entries are evicted beyond this
+    EMBED_CACHE_MAX: int = 4096
+
+    # Transcription backend: "api" (Whisper via HuggingFace Inference API,
+    # default) or "local" to run faster-whisper's int8 CTranslate2 model
+    # in-process, skipping the audio upload entirely.
+    WHISPER_BACKEND: str = os.getenv("TALKTOTUBE_WHISPER_BACKEND", "api")
+
+    # Windows processed per forward pass in batched local transcription
+    ASR_BATCH_SIZE: int = 16
     
     # Processing Configuration
     CHUNK_SIZE_TOKENS: int = 1000
@@ -35,6 +68,15 @@ class Config:
     # Retrieval Configuration
     SIMILARITY_THRESHOLD: float = 0.35
     TOP_K_CHUNKS: int = 5
+
+    # Semantic answer cache: questions this similar to a cached one reuse
+    # its answer instead of re-running retrieval + generation
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_SIZE: int = 512
+
+    # Chunk count above which retrieval switches from the NumPy matmul to a
+    # FAISS inner-product index (when faiss is installed)
+    FAISS_MIN_CHUNKS: int = 500
     
     # API Configuration
     HF_TIMEOUT_SECONDS: int = 30
@@ -43,6 +85,7 @@ class Config:
     
     # Text Processing
     MAX_CONTEXT_LENGTH: int = 2000  # Safe limit for most models
+    MAX_PROMPT_TOKENS: int = 512  # FLAN-T5 encoder input limit
     SUMMARY_PROMPT: str = (
         "Summarize the following transcript into 5–8 key bullet points. "
         "Include timestamps if present. Keep it concise and factual."
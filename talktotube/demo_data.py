@@ -1,7 +1,18 @@
 """Demo data for TalkToTube when YouTube API is not accessible."""
 
-# Sample transcript data for demonstration
-DEMO_TRANSCRIPT_DATA = [
+import re
+from types import MappingProxyType
+
+from .utils.text import chunk_transcript, normalize_transcript
+
+# One compiled alternation scans the URL once, case-insensitively,
+# instead of lowering it and checking four substrings
+_DEMO_URL_PATTERN = re.compile(r'demo|test|sample|example', re.IGNORECASE)
+
+# Sample transcript data for demonstration. The module-level data is
+# returned to every caller without copying, so it is frozen: a tuple of
+# read-only mapping views that still answer .get()/[] like plain dicts.
+_DEMO_TRANSCRIPT_SEGMENTS = [
     {'text': 'Welcome to this introduction to machine learning.', 'start': 0.0, 'duration': 3.5},
     {'text': 'Machine learning is a subset of artificial intelligence that enables computers to learn and make decisions from data.', 'start': 3.5, 'duration': 6.0},
     {'text': 'There are three main types of machine learning: supervised learning, unsupervised learning, and reinforcement learning.', 'start': 9.5, 'duration': 7.0},
@@ -24,13 +35,23 @@ DEMO_TRANSCRIPT_DATA = [
     {'text': 'Thank you for watching this introduction to machine learning. Keep practicing and exploring this exciting field!', 'start': 115.0, 'duration': 5.0}
 ]
 
-DEMO_VIDEO_INFO = {
+DEMO_TRANSCRIPT_DATA = tuple(
+    MappingProxyType(segment) for segment in _DEMO_TRANSCRIPT_SEGMENTS
+)
+
+DEMO_VIDEO_INFO = MappingProxyType({
     'video_id': 'demo_ml_intro',
     'title': 'Introduction to Machine Learning - Demo Video',
     'channel': 'TalkToTube Demo Channel',
     'duration': '2:00',
     'url': 'https://www.youtube.com/watch?v=demo_ml_intro'
-}
+})
+
+# The demo transcript is static, so its normalized text and chunks are
+# computed once at import — demo requests skip those pipeline stages
+DEMO_TRANSCRIPT_TEXT = normalize_transcript(DEMO_TRANSCRIPT_DATA)
+DEMO_CHUNKS = tuple(chunk_transcript(DEMO_TRANSCRIPT_TEXT))
+
 
 def get_demo_data():
     """Get demo transcript and video info."""
@@ -38,5 +59,4 @@ def get_demo_data():
 
 def is_demo_url(url: str) -> bool:
     """Check if URL is a demo URL."""
-    demo_keywords = ['demo', 'test', 'sample', 'example']
-    return any(keyword in url.lower() for keyword in demo_keywords)
+    return _DEMO_URL_PATTERN.search(url) is not None
@@ -1,19 +1,31 @@
 """Main processing pipeline for TalkToTube."""
 
+import asyncio
+import io
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
+import diskcache
+
 from .config import Config
 from .utils.text import normalize_transcript, chunk_transcript, TranscriptChunk
 from .agents.fetch_transcript import TranscriptFetcher
 from .agents.transcribe_fallback import TranscriptionAgent
 from .agents.summarize import SummarizationAgent
 from .agents.qa import QAAgent
-from .demo_data import get_demo_data, is_demo_url
+from .demo_data import DEMO_CHUNKS, DEMO_TRANSCRIPT_TEXT, get_demo_data, is_demo_url
 
 logger = logging.getLogger(__name__)
 
+# Transcript results keyed by video id: the download/transcribe stage is
+# deterministic in the video, so repeat URLs skip yt-dlp, ffmpeg, and
+# Whisper entirely
+_pipeline_cache = diskcache.Cache(Config.PIPELINE_CACHE_DIR)
+
 
 @dataclass
 class ProcessingResult:
@@ -36,7 +48,16 @@ class TalkToTubePipeline:
         self.transcription_agent = TranscriptionAgent()
         self.summarization_agent = SummarizationAgent()
         self.qa_agent = QAAgent()
-        
+
+        # process_videos runs process_video on several worker threads at
+        # once, but two stages mutate shared agent state per call: the
+        # transcription agent rewrites its yt-dlp output template and
+        # duration cap, and index_chunks sets the QA agent's chunks and
+        # embeddings in separate steps. These locks serialize just those
+        # stages so concurrent videos can't interleave that state
+        self._transcription_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
         logger.info("TalkToTube pipeline initialized")
     
     def process_video(self, url: str, max_duration: int = 3600) -> ProcessingResult:
@@ -56,79 +77,131 @@ class TalkToTubePipeline:
         logger.info(f"Starting video processing for: {url}")
 
         # Check if this is a demo URL or if we should use demo data
-        if is_demo_url(url) or 'demo' in url.lower():
+        transcript_text = None
+        chunks = None
+        video_id = None
+
+        if is_demo_url(url):
             logger.info("Using demo data for testing...")
             transcript_data, video_info = get_demo_data()
             processing_method = "demo_data"
+
+            # Normalization and chunking of the static demo transcript
+            # were done once at import
+            transcript_text = DEMO_TRANSCRIPT_TEXT
+            chunks = list(DEMO_CHUNKS)
         else:
-            # Step 1: Try to fetch transcript
-            transcript_data = None
-            video_info = None
-            processing_method = "transcript_api"
-
-            try:
-                logger.info("Attempting to fetch transcript via YouTube API...")
-                transcript_data, video_info = self.transcript_fetcher.fetch_transcript(url)
-                logger.info("Successfully fetched transcript from YouTube API")
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch transcript: {e}")
-
-                # Check if it's a YouTube API issue (common error)
-                error_msg = str(e).lower()
-                if 'no element found' in error_msg or 'xml' in error_msg:
-                    logger.info("YouTube API issue detected, using demo data for testing...")
-                    transcript_data, video_info = get_demo_data()
-                    processing_method = "demo_data_fallback"
-                else:
-                    logger.info("Falling back to audio transcription...")
-
-                    try:
-                        # Step 2: Fallback to audio transcription
-                        transcript_data = self.transcription_agent.transcribe_from_url(url, max_duration)
-                        processing_method = "audio_transcription"
-
-                        # Get basic video info
-                        video_id = self.transcript_fetcher.extract_video_id(url)
-                        video_info = self.transcript_fetcher.get_video_info(video_id) if video_id else {}
-
-                        logger.info("Successfully transcribed audio")
-
-                    except Exception as transcribe_error:
-                        logger.error(f"Audio transcription also failed: {transcribe_error}")
-                        logger.info("Using demo data as final fallback...")
+            video_id = self.transcript_fetcher.extract_video_id(url)
+
+            # Warm the per-video embedding cache from disk so revisits
+            # (and process restarts) skip the paid embedding calls
+            if video_id and not Config.NO_CACHE:
+                with self._index_lock:
+                    self.qa_agent.retriever.load(self._embedding_cache_path(video_id))
+
+            # Repeat requests for the same video reuse the cached result
+            # of the whole fetch/transcribe stage
+            cached = None
+            if video_id and not Config.NO_CACHE:
+                cached = _pipeline_cache.get(video_id)
+
+            if cached is not None:
+                transcript_data, video_info, processing_method = cached
+                logger.info(f"Using cached transcript for video {video_id}")
+            else:
+                # Step 1: Try to fetch transcript
+                transcript_data = None
+                video_info = None
+                processing_method = "transcript_api"
+
+                try:
+                    logger.info("Attempting to fetch transcript via YouTube API...")
+                    transcript_data, video_info = self.transcript_fetcher.fetch_transcript(url)
+                    logger.info("Successfully fetched transcript from YouTube API")
+
+                except Exception as e:
+                    logger.warning(f"Failed to fetch transcript: {e}")
+
+                    # Check if it's a YouTube API issue (common error)
+                    error_msg = str(e).lower()
+                    if 'no element found' in error_msg or 'xml' in error_msg:
+                        logger.info("YouTube API issue detected, using demo data for testing...")
                         transcript_data, video_info = get_demo_data()
-                        processing_method = "demo_data_final_fallback"
+                        processing_method = "demo_data_fallback"
+                    else:
+                        logger.info("Falling back to audio transcription...")
+
+                        try:
+                            # Step 2: Fallback to audio transcription. The
+                            # agent's download path and duration cap are
+                            # per-call state on a shared instance
+                            with self._transcription_lock:
+                                transcript_data = self.transcription_agent.transcribe_from_url(url, max_duration)
+                            processing_method = "audio_transcription"
+
+                            # Get basic video info
+                            video_info = self.transcript_fetcher.get_video_info(video_id) if video_id else {}
+
+                            logger.info("Successfully transcribed audio")
+
+                        except Exception as transcribe_error:
+                            logger.error(f"Audio transcription also failed: {transcribe_error}")
+                            logger.info("Using demo data as final fallback...")
+                            transcript_data, video_info = get_demo_data()
+                            processing_method = "demo_data_final_fallback"
+
+                # Only real results are worth keeping; demo fallbacks would
+                # mask transient API issues on the next run
+                if (
+                    video_id
+                    and not Config.NO_CACHE
+                    and transcript_data
+                    and processing_method in ("transcript_api", "audio_transcription")
+                ):
+                    _pipeline_cache.set(
+                        video_id,
+                        (transcript_data, video_info, processing_method),
+                        expire=Config.TRANSCRIPT_CACHE_TTL_SECONDS,
+                    )
         
         if not transcript_data:
             raise Exception("No transcript data obtained")
         
         # Step 3: Normalize transcript
-        logger.info("Normalizing transcript...")
-        transcript_text = normalize_transcript(transcript_data)
-        
+        if transcript_text is None:
+            logger.info("Normalizing transcript...")
+            transcript_text = normalize_transcript(transcript_data)
+
         if not transcript_text.strip():
             raise Exception("Transcript normalization resulted in empty text")
-        
+
         # Step 4: Detect language (basic implementation)
         language = self.detect_language(transcript_data, processing_method)
-        
+
         # Step 5: Chunk transcript
-        logger.info("Chunking transcript...")
-        chunks = chunk_transcript(transcript_text)
-        
+        if chunks is None:
+            logger.info("Chunking transcript...")
+            chunks = chunk_transcript(transcript_text)
+
         if not chunks:
             raise Exception("Failed to create transcript chunks")
         
-        # Step 6: Generate summary
-        logger.info("Generating summary...")
-        summary = self.summarization_agent.summarize_chunks(chunks)
-        bullet_points = self.summarization_agent.create_bullet_summary(transcript_text)
-        
-        # Step 7: Index chunks for Q&A
-        logger.info("Indexing chunks for Q&A...")
-        self.qa_agent.index_chunks(chunks)
-        
+        # Steps 6 and 7: summary, bullet summary, and Q&A indexing are
+        # independent I/O-bound calls — running them concurrently makes
+        # this stage cost max() of their latencies instead of the sum
+        logger.info("Generating summary and indexing chunks for Q&A...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            summary_future = executor.submit(self.summarization_agent.summarize_chunks, chunks)
+            bullets_future = executor.submit(self.summarization_agent.create_bullet_summary, transcript_text)
+            index_future = executor.submit(
+                self._index_and_persist, chunks,
+                [chunk.text for chunk in chunks], video_id
+            )
+
+            summary = summary_future.result()
+            bullet_points = bullets_future.result()
+            index_future.result()
+
         result = ProcessingResult(
             video_info=video_info or {},
             transcript_text=transcript_text,
@@ -146,6 +219,72 @@ class TalkToTubePipeline:
         
         return result
     
+    @staticmethod
+    def _embedding_cache_path(video_id: str) -> str:
+        """Path of the persisted embedding cache for a video."""
+        return os.path.join(Config.EMBEDDING_CACHE_DIR, f"{video_id}.npz")
+
+    def _index_and_persist(
+        self, chunks: List[TranscriptChunk], texts: List[str], video_id: Optional[str]
+    ) -> None:
+        """
+        Index chunks for Q&A and persist the embedding cache, atomically.
+
+        index_chunks sets the QA agent's chunks and embeddings in separate
+        steps; holding the lock across both (and the save) keeps one
+        video's chunks from being paired with another's embeddings when
+        process_videos overlaps several videos.
+        """
+        with self._index_lock:
+            self.qa_agent.index_chunks(chunks, texts)
+
+            if video_id and not Config.NO_CACHE:
+                try:
+                    self.qa_agent.retriever.save(self._embedding_cache_path(video_id))
+                except Exception as e:
+                    logger.warning(f"Could not persist embedding cache: {e}")
+
+    async def process_video_async(self, url: str, max_duration: int = 3600) -> ProcessingResult:
+        """
+        Async wrapper around process_video for event-loop callers.
+
+        The blocking pipeline (network fetches, retry sleeps, ffmpeg) runs
+        on a worker thread, so an asyncio application can process several
+        videos concurrently without the retry backoffs stalling its loop.
+
+        Args:
+            url: YouTube video URL
+            max_duration: Maximum video duration for transcription fallback
+
+        Returns:
+            ProcessingResult with all processed data
+        """
+        return await asyncio.to_thread(self.process_video, url, max_duration)
+
+    async def process_videos(
+        self, urls: List[str], max_duration: int = 3600
+    ) -> List[ProcessingResult]:
+        """
+        Process several videos concurrently through one shared pipeline.
+
+        Reusing a single pipeline instance means the agents, HTTP client,
+        and disk caches are set up once and amortized across the batch,
+        while the per-video work overlaps on worker threads. Stages that
+        mutate shared agent state (transcription fallback, Q&A indexing)
+        are serialized internally; the Q&A index ends up holding whichever
+        video finished last.
+
+        Args:
+            urls: YouTube video URLs
+            max_duration: Maximum video duration for transcription fallback
+
+        Returns:
+            List of ProcessingResult, in input order
+        """
+        return await asyncio.gather(
+            *(self.process_video_async(url, max_duration) for url in urls)
+        )
+
     def detect_language(self, transcript_data: List[Dict[str, Any]], method: str) -> str:
         """
         Detect language from transcript data.
@@ -188,6 +327,70 @@ class TalkToTubePipeline:
         """
         return self.qa_agent.answer_question(question, similarity_threshold, top_k)
     
+    def answer_question_stream(
+        self,
+        question: str,
+        similarity_threshold: float = None,
+        top_k: int = None
+    ):
+        """
+        Answer a question, yielding answer fragments as they arrive.
+
+        Citations for the streamed answer are available from
+        qa_agent.last_citations after the stream is consumed.
+
+        Args:
+            question: User question
+            similarity_threshold: Minimum similarity threshold
+            top_k: Number of chunks to retrieve
+
+        Yields:
+            Answer text fragments in generation order
+        """
+        return self.qa_agent.answer_question_stream(
+            question, similarity_threshold, top_k
+        )
+
+    async def answer_question_async(
+        self,
+        question: str,
+        similarity_threshold: float = None,
+        top_k: int = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Async wrapper around answer_question for concurrent workflows.
+
+        Independent questions can be dispatched with asyncio.gather so their
+        inference latency overlaps instead of serializing.
+
+        Args:
+            question: User question
+            similarity_threshold: Minimum similarity threshold
+            top_k: Number of chunks to retrieve
+
+        Returns:
+            Tuple of (answer, citations)
+        """
+        return await asyncio.to_thread(
+            self.answer_question, question, similarity_threshold, top_k
+        )
+
+    async def answer_questions(
+        self, questions: List[str]
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Answer several independent questions concurrently.
+
+        Args:
+            questions: User questions
+
+        Returns:
+            List of (answer, citations) tuples, in input order
+        """
+        return await asyncio.gather(
+            *(self.answer_question_async(q) for q in questions)
+        )
+
     def translate_content(self, text: str, target_language: str = "en") -> str:
         """
         Translate content to target language.
@@ -218,15 +421,17 @@ class TalkToTubePipeline:
         """
         if len(transcript_text) <= max_chars:
             return transcript_text
-        
-        # Find a good breaking point
-        truncated = transcript_text[:max_chars]
-        last_newline = truncated.rfind('\n')
-        
-        if last_newline > max_chars * 0.8:  # If we can keep most content
-            truncated = truncated[:last_newline]
-        
-        return truncated + "\n\n... (transcript continues)"
+
+        # Find a good breaking point with a bounded rfind — only newlines
+        # in the last 20% of the window count, so scan just that window
+        # and skip the intermediate truncated slice
+        window_start = int(max_chars * 0.8)
+        last_newline = transcript_text.rfind('\n', window_start, max_chars)
+
+        if last_newline == -1:
+            last_newline = max_chars
+
+        return transcript_text[:last_newline] + "\n\n... (transcript continues)"
     
     def export_to_markdown(
         self, 
@@ -244,45 +449,48 @@ class TalkToTubePipeline:
             Markdown formatted text
         """
         qa_history = qa_history or []
-        
-        # Build markdown content
-        markdown_parts = []
-        
+
+        # Write straight into one buffer instead of accumulating a parts
+        # list and joining it — long Q&A histories stay a single allocation
+        buf = io.StringIO()
+        write = buf.write
+
         # Title and metadata
         title = result.video_info.get('title', 'YouTube Video Analysis')
         channel = result.video_info.get('channel', 'Unknown Channel')
         url = result.video_info.get('url', '')
-        
-        markdown_parts.append(f"# {title}")
-        markdown_parts.append(f"**Channel:** {channel}")
+
+        write(f"# {title}\n")
+        write(f"**Channel:** {channel}\n")
         if url:
-            markdown_parts.append(f"**URL:** {url}")
-        markdown_parts.append(f"**Processing Method:** {result.processing_method}")
-        markdown_parts.append(f"**Language:** {result.language}")
-        markdown_parts.append("")
-        
+            write(f"**URL:** {url}\n")
+        write(f"**Processing Method:** {result.processing_method}\n")
+        write(f"**Language:** {result.language}\n")
+        write("\n")
+
         # Summary
-        markdown_parts.append("## Summary")
+        write("## Summary\n")
         for bullet in result.bullet_points:
-            markdown_parts.append(bullet)
-        markdown_parts.append("")
-        
+            write(bullet)
+            write("\n")
+        write("\n")
+
         # Q&A History
         if qa_history:
-            markdown_parts.append("## Questions & Answers")
+            write("## Questions & Answers\n")
             for i, (question, answer) in enumerate(qa_history, 1):
-                markdown_parts.append(f"### Q{i}: {question}")
-                markdown_parts.append(f"**A:** {answer}")
-                markdown_parts.append("")
-        
+                write(f"### Q{i}: {question}\n")
+                write(f"**A:** {answer}\n")
+                write("\n")
+
         # Transcript preview
         preview = self.get_transcript_preview(result.transcript_text)
-        markdown_parts.append("## Transcript Preview")
-        markdown_parts.append("```")
-        markdown_parts.append(preview)
-        markdown_parts.append("```")
-        
-        return "\n".join(markdown_parts)
+        write("## Transcript Preview\n")
+        write("```\n")
+        write(preview)
+        write("\n```")
+
+        return buf.getvalue()
     
     def clear_session(self) -> None:
         """Clear all session data."""
@@ -6,19 +6,144 @@ from typing import List, Tuple, Optional, Dict, Any
 
 from .config import Config
 from .pipeline import TalkToTubePipeline, ProcessingResult
+from .agents.fetch_transcript import TranscriptFetcher
 
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(show_spinner=False)
+def _get_pipeline() -> TalkToTubePipeline:
+    """Construct the pipeline once per server process, on first use."""
+    return TalkToTubePipeline()
+
+
+# Keyword groups for user-friendly error messages, scanned in order
+# against the casefolded message
+_ERROR_PATTERNS = (
+    (('sign in', 'bot'), "⚠️ This video requires sign-in or has bot protection. Please try a different public video."),
+    (('private', 'unavailable'), "⚠️ This video is private or unavailable. Please try a different public video."),
+    (('age',), "⚠️ This video is age-restricted. Please try a different video."),
+)
+
+
+def _set_url(url: str) -> None:
+    """Button callback: select a URL without forcing an extra rerun."""
+    st.session_state.current_url = url
+
+
+def _friendly_error_message(error_msg: str) -> str:
+    """Map a raw processing error to a user-friendly message."""
+    low = error_msg.casefold()
+
+    for keywords, message in _ERROR_PATTERNS:
+        if any(keyword in low for keyword in keywords):
+            return message
+
+    if 'transcript' in low and 'disabled' in low:
+        return "⚠️ Transcripts are disabled for this video. Please try a different video."
+    if 'too long' in low:
+        return f"⚠️ {error_msg} Please try a shorter video or increase the duration limit in settings."
+
+    return f"❌ {error_msg}"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_fetcher() -> TranscriptFetcher:
+    """
+    One TranscriptFetcher per server process.
+
+    Reusing the instance keeps its underlying HTTP connections alive
+    across clicks instead of re-initializing per request.
+    """
+    return TranscriptFetcher()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _quick_check_cached(url: str) -> Tuple[bool, str]:
+    """
+    Check video accessibility once per URL within a 5-minute window.
+
+    Users commonly re-click Process Video for the same URL while
+    tweaking settings; the TTL cache skips the repeated network check.
+    """
+    return _get_fetcher().quick_video_check(url)
+
+
+# Streamlit re-executes the script on every widget interaction, so the
+# expensive stages are cached at module level. The leading-underscore
+# pipeline argument is excluded from the cache key — results are keyed
+# on the URL/text, and reruns reuse the indexed result instead of
+# re-fetching, re-embedding, and re-summarizing.
+@st.cache_resource(show_spinner=False)
+def _process_video_cached(
+    _pipeline: TalkToTubePipeline, url: str, max_duration: int
+) -> ProcessingResult:
+    """Process a video once per (url, max_duration) across reruns."""
+    return _pipeline.process_video(url, max_duration)
+
+
+def _ensure_video_indexed(
+    pipeline: TalkToTubePipeline, result: ProcessingResult, url: str
+) -> None:
+    """
+    Point the shared Q&A agent at this result's chunks.
+
+    The process-video cache stores the ProcessingResult, but indexing is
+    a side effect on the shared qa_agent — after processing video B, a
+    cache hit for video A would otherwise answer A's questions from B's
+    index. On a fresh process the agent already holds this result's
+    chunk list, so re-indexing is skipped; on a hit the per-video
+    embedding cache is warmed from disk first, making the re-index a
+    cache-only pass with no embedding API calls.
+    """
+    if pipeline.qa_agent.chunks is result.chunks:
+        return
+
+    video_id = pipeline.transcript_fetcher.extract_video_id(url)
+    if video_id and not Config.NO_CACHE:
+        pipeline.qa_agent.retriever.load(pipeline._embedding_cache_path(video_id))
+    pipeline.qa_agent.index_chunks(result.chunks)
+
+
+@st.cache_data(show_spinner=False)
+def _transcript_preview_cached(
+    _pipeline: TalkToTubePipeline, transcript_text: str
+) -> str:
+    """Cache the rendered transcript preview per transcript text."""
+    return _pipeline.get_transcript_preview(transcript_text)
+
+
+@st.cache_data(show_spinner=False)
+def _export_markdown_cached(
+    _pipeline: TalkToTubePipeline,
+    _result: ProcessingResult,
+    url: str,
+    qa_history: Tuple[Tuple[str, str], ...],
+) -> str:
+    """Cache the markdown export per (url, Q&A history) combination."""
+    return _pipeline.export_to_markdown(_result, list(qa_history))
+
+
 class TalkToTubeUI:
     """Streamlit UI manager for TalkToTube."""
     
     def __init__(self):
         """Initialize the UI manager."""
-        self.pipeline = TalkToTubePipeline()
         self.setup_page_config()
         self.initialize_session_state()
-    
+
+    @property
+    def pipeline(self) -> TalkToTubePipeline:
+        """
+        Shared pipeline instance, constructed lazily.
+
+        Deferring construction to first use (and caching it across
+        reruns with st.cache_resource) keeps agent setup out of the
+        app's cold-start render.
+        """
+        return _get_pipeline()
+
+
     def setup_page_config(self) -> None:
         """Configure Streamlit page settings."""
         st.set_page_config(
@@ -125,10 +250,9 @@ class TalkToTubeUI:
 
         st.sidebar.markdown("---")
 
-        # Clear session button
-        if st.sidebar.button("🗑️ Clear Session"):
-            self.clear_session()
-            st.rerun()
+        # Clear session button; the callback runs before the natural
+        # rerun, so no explicit extra rerun is needed
+        st.sidebar.button("🗑️ Clear Session", on_click=self.clear_session)
         
         return {
             'similarity_threshold': similarity_threshold,
@@ -153,29 +277,35 @@ class TalkToTubeUI:
             help="Paste any public YouTube video URL here"
         )
 
-        # Add demo and example URLs
+        # Add demo and example URLs. on_click callbacks update session
+        # state during the click's own rerun — the old pattern of setting
+        # state and calling st.rerun() executed the whole script twice
         st.markdown("**💡 Try these options:**")
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            if st.button("🎯 Demo Mode", help="Use demo data to test all features", type="primary"):
-                st.session_state.current_url = "https://www.youtube.com/watch?v=demo_ml_intro"
-                st.rerun()
+            st.button(
+                "🎯 Demo Mode", help="Use demo data to test all features", type="primary",
+                on_click=_set_url, args=("https://www.youtube.com/watch?v=demo_ml_intro",)
+            )
 
         with col2:
-            if st.button("🎓 Educational", help="Khan Academy - What is Machine Learning?"):
-                st.session_state.current_url = "https://www.youtube.com/watch?v=ukzFI9rgwfU"
-                st.rerun()
+            st.button(
+                "🎓 Educational", help="Khan Academy - What is Machine Learning?",
+                on_click=_set_url, args=("https://www.youtube.com/watch?v=ukzFI9rgwfU",)
+            )
 
         with col3:
-            if st.button("🔬 Science", help="Crash Course - DNA Structure"):
-                st.session_state.current_url = "https://www.youtube.com/watch?v=8kK2zwjRV0M"
-                st.rerun()
+            st.button(
+                "🔬 Science", help="Crash Course - DNA Structure",
+                on_click=_set_url, args=("https://www.youtube.com/watch?v=8kK2zwjRV0M",)
+            )
 
         with col4:
-            if st.button("💻 Tech", help="Python Tutorial - Variables"):
-                st.session_state.current_url = "https://www.youtube.com/watch?v=Z1Yd7upQsXY"
-                st.rerun()
+            st.button(
+                "💻 Tech", help="Python Tutorial - Variables",
+                on_click=_set_url, args=("https://www.youtube.com/watch?v=Z1Yd7upQsXY",)
+            )
 
         if st.session_state.current_url and 'demo' in st.session_state.current_url:
             st.info("🎯 **Demo Mode**: Using sample data to demonstrate all TalkToTube features without YouTube API dependencies.")
@@ -243,9 +373,7 @@ class TalkToTubeUI:
             st.session_state.processing_status = "checking"
             st.info("🔍 Checking video accessibility...")
 
-            from .agents.fetch_transcript import TranscriptFetcher
-            fetcher = TranscriptFetcher()
-            is_accessible, error_msg = fetcher.quick_video_check(url)
+            is_accessible, error_msg = _quick_check_cached(url)
 
             if not is_accessible:
                 raise ValueError(error_msg)
@@ -253,8 +381,13 @@ class TalkToTubeUI:
             st.session_state.processing_status = "fetching"
             self.render_processing_status("fetching")
 
-            # Process the video
-            result = self.pipeline.process_video(url, config['max_duration'])
+            # Process the video (cached across reruns for the same URL)
+            result = _process_video_cached(self.pipeline, url, config['max_duration'])
+
+            # A cache hit skips process_video's side effect of indexing
+            # into the shared qa_agent, which may still hold another
+            # video's chunks — re-establish the index before Q&A
+            _ensure_video_indexed(self.pipeline, result, url)
             
             # Handle translation if requested
             if config['translate_to_english'] and result.language != 'en':
@@ -285,21 +418,7 @@ class TalkToTubeUI:
             st.session_state.processing_status = "error"
 
             # Provide user-friendly error messages
-            error_msg = str(e)
-            if 'sign in' in error_msg.lower() or 'bot' in error_msg.lower():
-                friendly_msg = "⚠️ This video requires sign-in or has bot protection. Please try a different public video."
-            elif 'private' in error_msg.lower() or 'unavailable' in error_msg.lower():
-                friendly_msg = "⚠️ This video is private or unavailable. Please try a different public video."
-            elif 'age' in error_msg.lower():
-                friendly_msg = "⚠️ This video is age-restricted. Please try a different video."
-            elif 'transcript' in error_msg.lower() and 'disabled' in error_msg.lower():
-                friendly_msg = "⚠️ Transcripts are disabled for this video. Please try a different video."
-            elif 'too long' in error_msg.lower():
-                friendly_msg = f"⚠️ {error_msg} Please try a shorter video or increase the duration limit in settings."
-            else:
-                friendly_msg = f"❌ {error_msg}"
-
-            self.render_processing_status("error", friendly_msg)
+            self.render_processing_status("error", _friendly_error_message(str(e)))
     
     def render_video_info(self, result: ProcessingResult) -> None:
         """
@@ -328,10 +447,14 @@ class TalkToTubeUI:
         st.markdown(f"**Language:** {result.language}")
         st.markdown(f"**Chunks:** {len(result.chunks)}")
     
+    # The result sections run as fragments so a widget interaction inside
+    # one (the Q&A input, the transcript expander, the export button)
+    # reruns only that section instead of re-executing the whole script
+    @st.fragment
     def render_summary(self, result: ProcessingResult) -> None:
         """
         Render summary section.
-        
+
         Args:
             result: Processing result
         """
@@ -343,6 +466,7 @@ class TalkToTubeUI:
         else:
             st.markdown(result.summary)
     
+    @st.fragment
     def render_transcript_preview(self, result: ProcessingResult) -> None:
         """
         Render transcript preview section.
@@ -352,11 +476,12 @@ class TalkToTubeUI:
         """
         st.header("📜 Transcript Preview")
         
-        preview = self.pipeline.get_transcript_preview(result.transcript_text)
+        preview = _transcript_preview_cached(self.pipeline, result.transcript_text)
         
         with st.expander("View Transcript", expanded=False):
             st.text(preview)
     
+    @st.fragment
     def render_qa_section(self, config: Dict[str, Any]) -> None:
         """
         Render Q&A section.
@@ -386,33 +511,44 @@ class TalkToTubeUI:
             ask_button = st.button("❓ Ask", type="primary")
         
         if ask_button and question:
-            with st.spinner("🤔 Thinking..."):
-                answer, citations = self.pipeline.answer_question(
+            # Stream the answer so tokens render as they arrive instead
+            # of blocking in a spinner until generation finishes
+            st.markdown(f"**Q:** {question}")
+            answer = st.write_stream(
+                self.pipeline.answer_question_stream(
                     question,
                     config['similarity_threshold'],
                     config['top_k']
                 )
-            
-            # Display answer
-            st.markdown(f"**Q:** {question}")
-            st.markdown(f"**A:** {answer}")
-            
+            )
+
+            citations = self.pipeline.qa_agent.last_citations
+            if citations and not any(citation in answer for citation in citations):
+                citation_text = " ".join(citations)
+                st.caption(f"Sources: {citation_text}")
+                answer = f"{answer} {citation_text}"
+
+
             # Store in history
             st.session_state.qa_history.append((question, answer))
             
-            # Clear input
+            # Clear input; rerunning only this fragment refreshes the
+            # Q&A history without re-rendering the other sections
             st.session_state.question_input = ""
-            st.rerun()
+            st.rerun(scope="fragment")
     
+    @st.fragment
     def render_export_section(self) -> None:
         """Render export section."""
         st.header("📤 Export")
-        
+
         if st.button("📋 Copy as Markdown"):
             result = st.session_state.processing_result
-            markdown_content = self.pipeline.export_to_markdown(
-                result, 
-                st.session_state.qa_history
+            markdown_content = _export_markdown_cached(
+                self.pipeline,
+                result,
+                st.session_state.current_url,
+                tuple(st.session_state.qa_history)
             )
             
             # Display markdown in a text area for copying
@@ -429,6 +565,8 @@ class TalkToTubeUI:
         st.session_state.qa_history = []
         st.session_state.current_url = ""
         st.session_state.processing_status = "ready"
+        _process_video_cached.clear()
+        _transcript_preview_cached.clear()
         self.pipeline.clear_session()
         st.success("Session cleared!")
     
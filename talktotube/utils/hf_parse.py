@@ -0,0 +1,34 @@
+"""Parsing helpers for HuggingFace Inference API responses."""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def extract_text(result: Any) -> str:
+    """
+    Extract generated text from an Inference API response.
+
+    The API returns a plain string, a dict keyed by 'generated_text' or
+    'text', or a list wrapping one of those; structural pattern matching
+    dispatches on the shape in one pass. Callers strip the result once.
+
+    Args:
+        result: Raw response from text_generation or similar endpoints
+
+    Returns:
+        The generated text, or str(result) for unrecognized shapes
+    """
+    match result:
+        case str():
+            return result
+        case {'generated_text': text} | {'text': text}:
+            return str(text)
+        case [first, *_]:
+            return extract_text(first)
+        case dict() if len(result) == 1:
+            return str(next(iter(result.values())))
+        case _:
+            logger.warning(f"Unexpected response format: {type(result)} - {result}")
+            return str(result)
@@ -0,0 +1,97 @@
+"""Shared retry helper with jittered exponential backoff."""
+
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+from huggingface_hub.utils import HfHubHTTPError
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+# Hot values bound once at import: the retry loop reads these every
+# iteration, and a module global is one LOAD_GLOBAL instead of a class
+# attribute dict lookup
+_MAX_RETRIES = Config.MAX_RETRIES
+_BACKOFF_BASE = Config.RETRY_BACKOFF_SECONDS[0]
+
+# Server errors are usually transient hiccups rather than throttling,
+# so they retry on a shorter base than the rate-limit backoff
+_SERVER_ERROR_BACKOFF = 0.5
+
+
+def rate_limit_retry(func: Callable, *args, **kwargs) -> Any:
+    """
+    Execute function with jittered exponential backoff retry.
+
+    On a 429 response the HF API's Retry-After header is honored when
+    present; other waits use exponential backoff with uniform jitter so
+    concurrent clients don't synchronize their retries. Non-429 client
+    errors (4xx) are permanent and fail immediately instead of burning
+    the remaining attempts.
+
+    Args:
+        func: Function to execute
+        *args: Function arguments
+        **kwargs: Function keyword arguments
+
+    Returns:
+        Function result
+
+    Raises:
+        Exception: If all retries are exhausted or the error is permanent
+    """
+    last_exception = None
+
+    for attempt in range(_MAX_RETRIES):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            last_exception = e
+
+            status_code = None
+            retry_after = None
+            if isinstance(e, HfHubHTTPError) and e.response is not None:
+                status_code = e.response.status_code
+                retry_after = e.response.headers.get("Retry-After")
+
+            # Client errors other than throttling never succeed on retry
+            if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                logger.error(f"Permanent client error {status_code}: {e}")
+                raise
+
+            if attempt < _MAX_RETRIES - 1:
+                wait_time = None
+                if status_code == 429 and retry_after is not None:
+                    # Retry-After is either delta-seconds or an HTTP-date
+                    # (RFC 9110); fall back to exponential backoff when it
+                    # is not a plain number
+                    try:
+                        wait_time = max(float(retry_after), 0.0)
+                    except ValueError:
+                        try:
+                            parsed = parsedate_to_datetime(retry_after)
+                        except (TypeError, ValueError):
+                            parsed = None
+                        if parsed is not None:
+                            if parsed.tzinfo is None:
+                                parsed = parsed.replace(tzinfo=timezone.utc)
+                            delta = parsed - datetime.now(timezone.utc)
+                            wait_time = max(delta.total_seconds(), 0.0)
+                if wait_time is None:
+                    base = (
+                        _SERVER_ERROR_BACKOFF
+                        if status_code is not None and status_code >= 500
+                        else _BACKOFF_BASE
+                    )
+                    wait_time = base * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+            else:
+                logger.error(f"All {_MAX_RETRIES} attempts failed")
+
+    raise last_exception
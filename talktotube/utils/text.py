@@ -1,86 +1,257 @@
 """Text processing utilities for transcript cleaning, chunking, and timestamp handling."""
 
+import functools
 import re
 import logging
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+from typing import Iterable, List, Dict, Any, Tuple, Optional, Union
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+# Hot-path patterns compiled once at import; per-call re.sub/re.match
+# with literal patterns would go through re's internal cache lookup on
+# every segment. The non-speech spans ([Music], (inaudible), HTML-like
+# tags, ♪ lyrics ♪) are removed by one alternation so each segment is
+# scanned once instead of four times; negated character classes keep
+# matching linear on long lines
+_RE_NONSPEECH = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>|♪[^♪]*♪')
 
-@dataclass
+# Opening characters of the non-speech spans above; most segments
+# contain none of them, so a cheap membership scan skips the regex
+_SPECIAL_OPENERS = "[(<♪"
+
+# Variant for the batched pass in normalize_transcript: segments are
+# joined with the \x1f unit separator and cleaned in one scan, so spans
+# must not match across it
+_RE_NONSPEECH_JOINED = re.compile(
+    r'\[[^\]\x1f]*\]|\([^)\x1f]*\)|<[^>\x1f]*>|♪[^♪\x1f]*♪'
+)
+# Anchored multiline form enumerates every timestamped line of a
+# transcript in one C-level scan; no split('\n') list, no per-line
+# match. [^\S\n] is horizontal whitespace — plain \s could swallow the
+# newline after an empty-text timestamp and capture the next line
+_RE_TS_LINE = re.compile(
+    r'^\[(\d{1,2}:\d{2}(?::\d{2})?)\][^\S\n]*(.*)$', re.MULTILINE
+)
+
+
+@dataclass(slots=True)
 class TranscriptChunk:
     """A chunk of transcript with metadata."""
     text: str
     start_time: float
     end_time: float
     chunk_id: int
-    
+    # Memoized citation string; slots rule out cached_property, so
+    # get_citation() fills this explicitly on first use
+    _citation: Optional[str] = field(default=None, repr=False, compare=False)
+
+
     def format_timestamp(self, seconds: float) -> str:
         """Format seconds to MM:SS or HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
-    
+        return format_timestamp(seconds)
+
+
     def get_citation(self) -> str:
-        """Get formatted citation with timestamps."""
-        start_str = self.format_timestamp(self.start_time)
-        end_str = self.format_timestamp(self.end_time)
-        return f"[{start_str}–{end_str}]"
+        """Get formatted citation with timestamps, computed once per chunk."""
+        # Called from several hot loops (context prep, citation checks,
+        # chunk summarization) — format once, memoize in the slot
+        if self._citation is None:
+            start_str = self.format_timestamp(self.start_time)
+            end_str = self.format_timestamp(self.end_time)
+            self._citation = f"[{start_str}–{end_str}]"
+        return self._citation
+
 
+@dataclass
+class TranscriptSegments:
+    """
+    Transcript segments in struct-of-arrays layout.
 
-def normalize_transcript(transcript_data: List[Dict[str, Any]]) -> str:
+    Timing lives in parallel float32 arrays instead of one dict per segment,
+    so time-window queries vectorize and per-segment dict overhead goes away.
+    """
+    texts: List[str]
+    starts: np.ndarray
+    durations: np.ndarray
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict[str, Any]]) -> "TranscriptSegments":
+        """Build from the list-of-dicts form returned by the fetchers."""
+        count = len(segments)
+        return cls(
+            texts=[seg.get('text', '') for seg in segments],
+            starts=np.fromiter(
+                (seg.get('start', 0) for seg in segments),
+                dtype=np.float32, count=count
+            ),
+            durations=np.fromiter(
+                (seg.get('duration', 0) for seg in segments),
+                dtype=np.float32, count=count
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def time_window(self, start: float, end: float) -> np.ndarray:
+        """Indices of segments whose start time falls in [start, end)."""
+        mask = (self.starts >= start) & (self.starts < end)
+        return np.nonzero(mask)[0]
+
+    def to_segments(self) -> List[Dict[str, Any]]:
+        """Convert back to the list-of-dicts form for legacy consumers."""
+        return [
+            {'text': text, 'start': float(start), 'duration': float(duration)}
+            for text, start, duration in zip(self.texts, self.starts, self.durations)
+        ]
+
+
+def _collect_raw_segments(
+    transcript_data: Union[Iterable[Dict[str, Any]], TranscriptSegments]
+) -> List[Tuple[str, float, float]]:
+    """Gather non-blank (text, start, duration) tuples from either input form."""
+    # SoA input walks three parallel arrays with zip — no dict lookup
+    # per field per segment
+    if isinstance(transcript_data, TranscriptSegments):
+        segment_fields = zip(
+            transcript_data.texts,
+            transcript_data.starts,
+            transcript_data.durations,
+        )
+    else:
+        segment_fields = (
+            (segment.get('text', ''), segment.get('start', 0), segment.get('duration', 0))
+            for segment in transcript_data
+        )
+
+    return [
+        (raw_text, start_time, duration)
+        for raw_text, start_time, duration in segment_fields
+        if raw_text.strip()
+    ]
+
+
+def normalize_transcript(
+    transcript_data: Union[Iterable[Dict[str, Any]], TranscriptSegments]
+) -> str:
     """
     Normalize transcript data from youtube-transcript-api or Whisper.
-    
+
     Args:
-        transcript_data: List of transcript segments with 'text', 'start', 'duration'
-        
+        transcript_data: Iterable of transcript segments with 'text', 'start',
+            'duration' (a list or a streaming iterator), or a
+            TranscriptSegments struct-of-arrays
+
     Returns:
         Normalized transcript text with timestamps preserved
     """
     if not transcript_data:
         return ""
-    
-    normalized_segments = []
-    
-    for segment in transcript_data:
-        text = segment.get('text', '').strip()
-        if not text:
+
+    raw_segments = _collect_raw_segments(transcript_data)
+    if not raw_segments:
+        return ""
+
+    # Clean every segment with one regex pass over the joined text
+    # instead of one engine invocation per segment; the unit separator
+    # never appears in caption text, so the split restores alignment
+    # (the joined pattern refuses to match across it)
+    joined = '\x1f'.join(raw_text for raw_text, _, _ in raw_segments)
+    cleaned_parts = _RE_NONSPEECH_JOINED.sub('', joined).split('\x1f')
+
+    return _assemble_normalized(cleaned_parts, raw_segments)
+
+
+def normalize_transcripts_batch(
+    transcripts: List[Union[List[Dict[str, Any]], TranscriptSegments]]
+) -> List[str]:
+    """
+    Normalize several transcripts with one shared cleaning pass.
+
+    All segments from all transcripts are joined into one blob so the
+    non-speech regex scans once regardless of how many videos a session
+    processes; per-transcript merging and formatting then run on the
+    cleaned slices.
+
+    Args:
+        transcripts: One transcript per entry, in either input form
+            accepted by normalize_transcript
+
+    Returns:
+        Normalized transcript text for each input, in order
+    """
+    if not transcripts:
+        return []
+
+    raw_per_transcript = [
+        _collect_raw_segments(transcript) if transcript else []
+        for transcript in transcripts
+    ]
+
+    joined = '\x1f'.join(
+        raw_text
+        for raw_segments in raw_per_transcript
+        for raw_text, _, _ in raw_segments
+    )
+    cleaned_parts = _RE_NONSPEECH_JOINED.sub('', joined).split('\x1f')
+
+    results = []
+    offset = 0
+    for raw_segments in raw_per_transcript:
+        if not raw_segments:
+            results.append("")
             continue
-            
-        # Clean up text
-        text = clean_transcript_text(text)
-        if not text:
+        end = offset + len(raw_segments)
+        results.append(_assemble_normalized(cleaned_parts[offset:end], raw_segments))
+        offset = end
+    return results
+
+
+def _assemble_normalized(
+    cleaned_parts: List[str],
+    raw_segments: List[Tuple[str, float, float]],
+) -> str:
+    """Merge cleaned segments and render the timestamped transcript text."""
+    # Parallel lists instead of one dict per segment — the merge below
+    # works on the struct-of-arrays layout directly
+    seg_texts: List[str] = []
+    seg_starts: List[float] = []
+    seg_durations: List[float] = []
+
+    for text, (_, start_time, duration) in zip(cleaned_parts, raw_segments):
+        # Native split/join collapses whitespace runs without another
+        # regex dispatch per segment
+        text = ' '.join(text.split())
+        # Very short leftovers are likely artifacts, same as
+        # clean_transcript_text's own cutoff
+        if len(text) < 3:
             continue
-            
-        # Preserve timing information
-        start_time = segment.get('start', 0)
-        duration = segment.get('duration', 0)
-        
-        normalized_segments.append({
-            'text': text,
-            'start': start_time,
-            'duration': duration
-        })
-    
+
+        seg_texts.append(text)
+        seg_starts.append(start_time)
+        seg_durations.append(duration)
+
+    if not seg_texts:
+        return ""
+
     # Merge short segments
-    merged_segments = merge_short_segments(normalized_segments)
-    
-    # Convert to text with timestamps
-    result_parts = []
-    for segment in merged_segments:
-        start_str = format_timestamp(segment['start'])
-        text = segment['text']
-        result_parts.append(f"[{start_str}] {text}")
-    
-    return "\n".join(result_parts)
+    merged_texts, merged_starts, _ = _merge_short_soa(
+        seg_texts,
+        np.asarray(seg_starts, dtype=np.float64),
+        np.asarray(seg_durations, dtype=np.float64),
+    )
+
+    # Convert to text with timestamps; feeding the generator straight to
+    # join skips the intermediate result list
+    return "\n".join(
+        f"[{format_timestamp(start)}] {text}"
+        for text, start in zip(merged_texts, merged_starts.tolist())
+    )
 
 
 def clean_transcript_text(text: str) -> str:
@@ -96,15 +267,16 @@ def clean_transcript_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove common non-speech tags and artifacts
-    text = re.sub(r'\[.*?\]', '', text)  # Remove [Music], [Applause], etc.
-    text = re.sub(r'\(.*?\)', '', text)  # Remove (inaudible), etc.
-    text = re.sub(r'<.*?>', '', text)    # Remove HTML-like tags
-    text = re.sub(r'♪.*?♪', '', text)    # Remove music notes
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    # Remove common non-speech tags and artifacts in one scan; most
+    # segments have no opener at all, and four C-level substring checks
+    # are far cheaper than a regex pass that would no-op anyway
+    if any(opener in text for opener in _SPECIAL_OPENERS):
+        text = _RE_NONSPEECH.sub('', text)
+
+    # Collapse whitespace runs with the C-implemented split/join —
+    # no-arg split also drops leading/trailing whitespace, subsuming
+    # the strip
+    text = ' '.join(text.split())
     
     # Remove very short segments (likely artifacts)
     if len(text) < 3:
@@ -113,56 +285,119 @@ def clean_transcript_text(text: str) -> str:
     return text
 
 
+def _merge_short_soa(
+    texts: List[str],
+    starts: np.ndarray,
+    durations: np.ndarray,
+    min_duration: float = 2.0,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Merge short segments in struct-of-arrays form.
+
+    Timing decisions read plain float arrays instead of per-segment
+    dicts, and the segment end times come from one vectorized add.
+
+    Args:
+        texts: Segment texts
+        starts: Segment start times (float array, same length as texts)
+        durations: Segment durations (float array, same length as texts)
+        min_duration: Minimum duration for a segment
+
+    Returns:
+        Tuple of (texts, starts, durations) for the merged segments
+    """
+    ends = (starts + durations).tolist()
+    starts_list = starts.tolist()
+
+    merged_texts: List[str] = []
+    merged_starts: List[float] = []
+    merged_durations: List[float] = []
+
+    current_parts = [texts[0]]
+    current_start = starts_list[0]
+    current_end = ends[0]
+
+    for i in range(1, len(texts)):
+        # If the current segment is too short, merge with the next
+        if current_end - current_start < min_duration:
+            current_parts.append(texts[i])
+            current_end = max(current_end, ends[i])
+        else:
+            # Current segment is long enough, save it and start a new one
+            merged_texts.append(" ".join(current_parts))
+            merged_starts.append(current_start)
+            merged_durations.append(current_end - current_start)
+            current_parts = [texts[i]]
+            current_start = starts_list[i]
+            current_end = ends[i]
+
+    # Add the last segment
+    merged_texts.append(" ".join(current_parts))
+    merged_starts.append(current_start)
+    merged_durations.append(current_end - current_start)
+
+    return (
+        merged_texts,
+        np.asarray(merged_starts, dtype=np.float64),
+        np.asarray(merged_durations, dtype=np.float64),
+    )
+
+
 def merge_short_segments(segments: List[Dict[str, Any]], min_duration: float = 2.0) -> List[Dict[str, Any]]:
     """
     Merge short segments to create more coherent chunks.
-    
+
     Args:
         segments: List of transcript segments
         min_duration: Minimum duration for a segment
-        
+
     Returns:
         List of merged segments
     """
     if not segments:
         return []
-    
-    merged = []
-    current_segment = segments[0].copy()
-    
-    for next_segment in segments[1:]:
-        current_duration = current_segment['duration']
-        
-        # If current segment is too short, merge with next
-        if current_duration < min_duration:
-            # Merge text
-            current_segment['text'] += " " + next_segment['text']
-            # Update duration to include next segment
-            next_end = next_segment['start'] + next_segment['duration']
-            current_end = current_segment['start'] + current_segment['duration']
-            current_segment['duration'] = max(next_end, current_end) - current_segment['start']
-        else:
-            # Current segment is long enough, save it and start new one
-            merged.append(current_segment)
-            current_segment = next_segment.copy()
-    
-    # Add the last segment
-    merged.append(current_segment)
-    
-    return merged
 
+    merged_texts, merged_starts, merged_durations = _merge_short_soa(
+        [segment['text'] for segment in segments],
+        np.fromiter(
+            (segment['start'] for segment in segments),
+            dtype=np.float64, count=len(segments)
+        ),
+        np.fromiter(
+            (segment['duration'] for segment in segments),
+            dtype=np.float64, count=len(segments)
+        ),
+        min_duration=min_duration,
+    )
+
+    return [
+        {'text': text, 'start': start, 'duration': duration}
+        for text, start, duration in zip(
+            merged_texts, merged_starts.tolist(), merged_durations.tolist()
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_ts_cached(int_seconds: int) -> str:
+    """Format whole seconds to MM:SS or HH:MM:SS, memoized per value."""
+    # Two divmods replace three separate divisions/modulos, and the LRU
+    # cache reuses the formatted string for the many repeated start
+    # values seen while normalizing, chunking, and citing transcripts
+    minutes, secs = divmod(int_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
 
-def format_timestamp(seconds: float) -> str:
-    """Format seconds to MM:SS or HH:MM:SS format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     return f"{minutes:02d}:{secs:02d}"
 
 
+def format_timestamp(seconds: float) -> str:
+    """Format seconds to MM:SS or HH:MM:SS format."""
+    # Truncate before the cache lookup so 12.1 and 12.7 share one entry
+    return _format_ts_cached(int(seconds))
+
+
 def estimate_tokens(text: str) -> int:
     """
     Estimate token count for text (rough approximation).
@@ -177,87 +412,122 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
-def chunk_transcript(transcript_text: str, chunk_size: int = None, overlap_percent: float = None) -> List[TranscriptChunk]:
+def chunk_transcript_soa(
+    transcript_text: str,
+    chunk_size: int = None,
+    overlap_percent: float = None,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
     """
-    Chunk transcript into overlapping segments with preserved timestamps.
-    
+    Chunk a transcript into struct-of-arrays form.
+
+    Same algorithm as chunk_transcript, but the result is parallel
+    arrays — texts plus float start/end time arrays — so consumers that
+    filter chunks by time can use one vectorized mask instead of
+    iterating chunk objects.
+
     Args:
         transcript_text: Normalized transcript with timestamps
         chunk_size: Target chunk size in tokens (defaults to config)
         overlap_percent: Overlap percentage (defaults to config)
-        
+
     Returns:
-        List of transcript chunks
+        Tuple of (texts, start_times, end_times); chunk ids are the
+        positions in these arrays
     """
     chunk_size = chunk_size or Config.CHUNK_SIZE_TOKENS
     overlap_percent = overlap_percent or Config.CHUNK_OVERLAP_PERCENT
-    
-    # Parse transcript lines with timestamps
-    lines = transcript_text.strip().split('\n')
-    segments = []
-    
-    for line in lines:
-        if not line.strip():
-            continue
-            
-        # Extract timestamp and text
-        match = re.match(r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*(.*)', line)
-        if match:
-            timestamp_str, text = match.groups()
-            start_time = parse_timestamp(timestamp_str)
-            segments.append({
-                'text': text,
-                'start_time': start_time,
-                'line': line
-            })
-    
-    if not segments:
+
+    # Parse transcript lines with timestamps into parallel arrays —
+    # the chunking loop below only ever needs the text and start time,
+    # so there is no reason to allocate a dict per line. The multiline
+    # pattern walks the whole transcript in one scan instead of
+    # splitting into lines and matching each one
+    seg_texts: List[str] = []
+    seg_starts: List[float] = []
+
+    for match in _RE_TS_LINE.finditer(transcript_text):
+        seg_texts.append(match.group(2))
+        seg_starts.append(parse_timestamp(match.group(1)))
+
+    if not seg_texts:
         logger.warning("No valid segments found in transcript")
-        return []
-    
+        return [], np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    segment_count = len(seg_texts)
+
+    # Cumulative token counts let each chunk boundary be found with one
+    # binary search instead of walking segments one by one in Python.
+    # The shift inlines estimate_tokens' len(text) // 4 — no function
+    # call per segment
+    token_counts = np.fromiter(
+        (len(text) >> 2 for text in seg_texts),
+        dtype=np.int64, count=segment_count
+    )
+    cumulative_tokens = np.cumsum(token_counts)
+
     # Create chunks
-    chunks = []
-    chunk_id = 0
+    chunk_texts: List[str] = []
+    chunk_starts: List[float] = []
+    chunk_ends: List[float] = []
     i = 0
-    
-    while i < len(segments):
-        chunk_text_parts = []
-        chunk_start_time = segments[i]['start_time']
-        chunk_end_time = chunk_start_time
-        current_tokens = 0
-        
-        # Add segments to chunk until we reach target size
-        j = i
-        while j < len(segments) and current_tokens < chunk_size:
-            segment = segments[j]
-            segment_text = segment['text']
-            segment_tokens = estimate_tokens(segment_text)
-            
-            if current_tokens + segment_tokens <= chunk_size or len(chunk_text_parts) == 0:
-                chunk_text_parts.append(segment_text)
-                chunk_end_time = segment['start_time']
-                current_tokens += segment_tokens
-                j += 1
-            else:
-                break
-        
+
+    while i < segment_count:
+        # Largest j with sum(token_counts[i:j]) <= chunk_size, stopping
+        # as soon as the budget is met exactly (the left search keeps
+        # zero-token segments past an exact boundary out, matching the
+        # old walker); always take at least one segment so oversized
+        # lines still chunk
+        target = (cumulative_tokens[i - 1] if i else 0) + chunk_size
+        right = np.searchsorted(cumulative_tokens, target, side='right')
+        left = np.searchsorted(cumulative_tokens, target, side='left')
+        j = max(int(min(left + 1, right)), i + 1)
+
         # Create chunk
-        chunk_text = " ".join(chunk_text_parts)
+        chunk_text = " ".join(seg_texts[i:j])
         if chunk_text.strip():
-            chunks.append(TranscriptChunk(
-                text=chunk_text,
-                start_time=chunk_start_time,
-                end_time=chunk_end_time,
-                chunk_id=chunk_id
-            ))
-            chunk_id += 1
-        
+            chunk_texts.append(chunk_text)
+            chunk_starts.append(seg_starts[i])
+            chunk_ends.append(seg_starts[j - 1])
+
         # Calculate overlap for next chunk
-        overlap_segments = max(1, int(len(chunk_text_parts) * overlap_percent))
+        overlap_segments = max(1, int((j - i) * overlap_percent))
         i = max(i + 1, j - overlap_segments)
-    
-    logger.info(f"Created {len(chunks)} chunks from transcript")
-    return chunks
+
+    logger.info(f"Created {len(chunk_texts)} chunks from transcript")
+    return (
+        chunk_texts,
+        np.asarray(chunk_starts, dtype=np.float64),
+        np.asarray(chunk_ends, dtype=np.float64),
+    )
+
+
+def chunk_transcript(transcript_text: str, chunk_size: int = None, overlap_percent: float = None) -> List[TranscriptChunk]:
+    """
+    Chunk transcript into overlapping segments with preserved timestamps.
+
+    Args:
+        transcript_text: Normalized transcript with timestamps
+        chunk_size: Target chunk size in tokens (defaults to config)
+        overlap_percent: Overlap percentage (defaults to config)
+
+    Returns:
+        List of transcript chunks
+    """
+    chunk_texts, chunk_starts, chunk_ends = chunk_transcript_soa(
+        transcript_text, chunk_size, overlap_percent
+    )
+
+    return [
+        TranscriptChunk(
+            text=text,
+            start_time=start_time,
+            end_time=end_time,
+            chunk_id=chunk_id,
+        )
+        for chunk_id, (text, start_time, end_time) in enumerate(
+            zip(chunk_texts, chunk_starts.tolist(), chunk_ends.tolist())
+        )
+    ]
 
 
 def parse_timestamp(timestamp_str: str) -> float:
@@ -270,14 +540,18 @@ def parse_timestamp(timestamp_str: str) -> float:
     Returns:
         Time in seconds
     """
-    parts = timestamp_str.split(':')
-    
-    if len(parts) == 2:  # MM:SS
-        minutes, seconds = map(int, parts)
-        return minutes * 60 + seconds
-    elif len(parts) == 3:  # HH:MM:SS
-        hours, minutes, seconds = map(int, parts)
-        return hours * 3600 + minutes * 60 + seconds
-    else:
+    # Timestamps come from the _RE_TS_LINE groups, so the shape is
+    # already validated — parse fixed positions by slicing instead of
+    # allocating a split list and a map iterator
+    try:
+        if len(timestamp_str) <= 5:  # M:SS or MM:SS
+            return int(timestamp_str[:-3]) * 60 + int(timestamp_str[-2:])
+        # H:MM:SS or HH:MM:SS
+        return (
+            int(timestamp_str[:-6]) * 3600
+            + int(timestamp_str[-5:-3]) * 60
+            + int(timestamp_str[-2:])
+        )
+    except ValueError:
         logger.warning(f"Invalid timestamp format: {timestamp_str}")
         return 0.0
@@ -0,0 +1,8 @@
+"""Shared pytest configuration for TalkToTube tests."""
+
+import os
+
+# Disable the transcript disk cache so tests always exercise the real code
+# paths and never leak state between runs. Must be set before talktotube
+# modules are imported, since Config reads the environment at import time.
+os.environ["TALKTOTUBE_NO_CACHE"] = "true"
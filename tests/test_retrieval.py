@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch
+from talktotube.config import Config
 from talktotube.utils.retrieval import EmbeddingRetriever
 from talktotube.utils.text import TranscriptChunk
 
@@ -12,7 +13,7 @@ class TestEmbeddingRetriever:
     
     def setup_method(self):
         """Set up test fixtures."""
-        with patch('talktotube.utils.retrieval.InferenceClient'):
+        with patch('talktotube.utils.retrieval.get_client'):
             self.retriever = EmbeddingRetriever()
     
     def test_cosine_similarity_identical(self):
@@ -161,6 +162,7 @@ class TestEmbeddingRetriever:
             with pytest.raises(ValueError, match="Number of chunks and embeddings must match"):
                 self.retriever.find_similar_chunks("query", chunks, embeddings)
     
+    @patch.object(Config, 'OFFLINE_MODE', False)
     @patch.object(EmbeddingRetriever, 'rate_limit_retry')
     def test_get_embedding_caching(self, mock_retry):
         """Test that embeddings are cached properly."""
@@ -177,20 +179,42 @@ class TestEmbeddingRetriever:
         # Results should be identical
         np.testing.assert_array_equal(embedding1, embedding2)
     
-    @patch.object(EmbeddingRetriever, 'get_embedding')
-    def test_get_embeddings_batch(self, mock_get_embedding):
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test that cached embeddings persist to disk and load back."""
+        path = str(tmp_path / "embeddings.npz")
+        self.retriever.embeddings_cache["first"] = np.array([1.0, 0.0, 0.0])
+        self.retriever.embeddings_cache["second"] = np.array([0.0, 1.0, 0.0])
+
+        self.retriever.save(path)
+        self.retriever.clear_cache()
+        assert len(self.retriever.embeddings_cache) == 0
+
+        assert self.retriever.load(path) is True
+        assert len(self.retriever.embeddings_cache) == 2
+        np.testing.assert_array_equal(
+            self.retriever.embeddings_cache["first"], np.array([1.0, 0.0, 0.0])
+        )
+
+    def test_load_missing_file(self, tmp_path):
+        """Test that loading a nonexistent cache file reports failure."""
+        assert self.retriever.load(str(tmp_path / "missing.npz")) is False
+
+    @patch.object(Config, 'OFFLINE_MODE', False)
+    @patch.object(EmbeddingRetriever, '_get_embedding_batch')
+    def test_get_embeddings_batch(self, mock_batch):
         """Test batch embedding generation."""
-        mock_get_embedding.side_effect = [
-            np.array([1, 0, 0]),
-            np.array([0, 1, 0]),
-            np.array([0, 0, 1])
-        ]
-        
+        mock_batch.return_value = np.array([
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1]
+        ])
+
         texts = ["text1", "text2", "text3"]
         embeddings = self.retriever.get_embeddings_batch(texts)
-        
+
         assert len(embeddings) == 3
-        assert mock_get_embedding.call_count == 3
+        # All three texts go out in a single batched request
+        assert mock_batch.call_count == 1
         
         # Check that each embedding is correct
         np.testing.assert_array_equal(embeddings[0], np.array([1, 0, 0]))
@@ -11,7 +11,7 @@ class TestSummarizationAgent:
     
     def setup_method(self):
         """Set up test fixtures."""
-        with patch('talktotube.agents.summarize.InferenceClient'):
+        with patch('talktotube.agents.summarize.get_client'):
             self.agent = SummarizationAgent()
     
     def test_prepare_text_for_summarization_short_text(self):
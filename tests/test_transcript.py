@@ -41,7 +41,18 @@ class TestTranscriptFetcher:
         url = "https://example.com/not-youtube"
         video_id = self.fetcher.extract_video_id(url)
         assert video_id is None
-    
+
+    def test_extract_video_id_cached(self):
+        """Test that repeated extraction of the same URL hits the memo cache."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        hits_before = self.fetcher.extract_video_id.cache_info().hits
+        first = self.fetcher.extract_video_id(url)
+        second = self.fetcher.extract_video_id(url)
+
+        assert first == second == "dQw4w9WgXcQ"
+        assert self.fetcher.extract_video_id.cache_info().hits > hits_before
+
     def test_get_video_info(self):
         """Test basic video info retrieval."""
         video_id = "dQw4w9WgXcQ"
@@ -54,8 +65,8 @@ class TestTranscriptFetcher:
         assert 'duration' in info
         assert 'url' in info
     
-    @patch('talktotube.agents.fetch_transcript.YouTubeTranscriptApi')
-    def test_fetch_transcript_success(self, mock_api):
+    @patch('talktotube.agents.fetch_transcript.TranscriptListFetcher')
+    def test_fetch_transcript_success(self, mock_list_fetcher):
         """Test successful transcript fetching."""
         # Mock transcript data
         mock_transcript_data = [
@@ -63,17 +74,18 @@ class TestTranscriptFetcher:
             {'text': 'This is a test', 'start': 2.0, 'duration': 3.0}
         ]
         
-        # Mock transcript object
+        # Mock manually created transcript object
         mock_transcript = Mock()
         mock_transcript.fetch.return_value = mock_transcript_data
         mock_transcript.language_code = 'en'
-        
+        mock_transcript.is_generated = False
+
         # Mock transcript list
         mock_transcript_list = Mock()
-        mock_transcript_list.find_manually_created_transcript.return_value = mock_transcript
-        
-        # Mock API
-        mock_api.list_transcripts.return_value = mock_transcript_list
+        mock_transcript_list.__iter__ = Mock(return_value=iter([mock_transcript]))
+
+        # Mock listing fetcher
+        mock_list_fetcher.return_value.fetch.return_value = mock_transcript_list
         
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         transcript_data, video_info = self.fetcher.fetch_transcript(url)
@@ -82,26 +94,26 @@ class TestTranscriptFetcher:
         assert isinstance(video_info, dict)
         assert video_info['video_id'] == "dQw4w9WgXcQ"
     
-    @patch('talktotube.agents.fetch_transcript.YouTubeTranscriptApi')
-    def test_fetch_transcript_no_manual_fallback_to_auto(self, mock_api):
+    @patch('talktotube.agents.fetch_transcript.TranscriptListFetcher')
+    def test_fetch_transcript_no_manual_fallback_to_auto(self, mock_list_fetcher):
         """Test fallback to auto-generated transcript."""
         # Mock transcript data
         mock_transcript_data = [
             {'text': 'Auto generated', 'start': 0.0, 'duration': 2.0}
         ]
         
-        # Mock auto-generated transcript
+        # Mock auto-generated transcript (no manual transcript available)
         mock_auto_transcript = Mock()
         mock_auto_transcript.fetch.return_value = mock_transcript_data
         mock_auto_transcript.language_code = 'en'
-        
+        mock_auto_transcript.is_generated = True
+
         # Mock transcript list
         mock_transcript_list = Mock()
-        mock_transcript_list.find_manually_created_transcript.side_effect = Exception("No manual transcript")
-        mock_transcript_list.find_generated_transcript.return_value = mock_auto_transcript
-        
-        # Mock API
-        mock_api.list_transcripts.return_value = mock_transcript_list
+        mock_transcript_list.__iter__ = Mock(return_value=iter([mock_auto_transcript]))
+
+        # Mock listing fetcher
+        mock_list_fetcher.return_value.fetch.return_value = mock_transcript_list
         
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         transcript_data, video_info = self.fetcher.fetch_transcript(url)
@@ -114,27 +126,27 @@ class TestTranscriptFetcher:
         available = self.fetcher.is_transcript_available(url)
         assert available is False
     
-    @patch('talktotube.agents.fetch_transcript.YouTubeTranscriptApi')
-    def test_is_transcript_available_success(self, mock_api):
+    @patch('talktotube.agents.fetch_transcript.TranscriptListFetcher')
+    def test_is_transcript_available_success(self, mock_list_fetcher):
         """Test transcript availability check with valid video."""
         # Mock transcript list with available transcripts
         mock_transcript_list = Mock()
         mock_transcript_list.__iter__ = Mock(return_value=iter([Mock(), Mock()]))
         
-        mock_api.list_transcripts.return_value = mock_transcript_list
+        mock_list_fetcher.return_value.fetch.return_value = mock_transcript_list
         
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         available = self.fetcher.is_transcript_available(url)
         assert available is True
     
-    @patch('talktotube.agents.fetch_transcript.YouTubeTranscriptApi')
-    def test_is_transcript_available_no_transcripts(self, mock_api):
+    @patch('talktotube.agents.fetch_transcript.TranscriptListFetcher')
+    def test_is_transcript_available_no_transcripts(self, mock_list_fetcher):
         """Test transcript availability check with no available transcripts."""
         # Mock transcript list with no transcripts
         mock_transcript_list = Mock()
         mock_transcript_list.__iter__ = Mock(return_value=iter([]))
         
-        mock_api.list_transcripts.return_value = mock_transcript_list
+        mock_list_fetcher.return_value.fetch.return_value = mock_transcript_list
         
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         available = self.fetcher.is_transcript_available(url)